@@ -3,61 +3,105 @@
 Comprehensive test script to test all 21 portals individually
 """
 
+import array
 import asyncio
 import sys
 import os
 import time
 import traceback
+import queue
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from main import ProcurementScanner
+from config import bidsandtenders_search_url
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
-# Set up detailed logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('portal_test_results.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Province/territory codes accepted by the Bids&Tenders region filter
+BIDSANDTENDERS_REGIONS = (
+    ("AB", "Alberta"),
+    ("BC", "BC"),
+    ("MB", "Manitoba"),
+    ("NB", "New Brunswick"),
+    ("NL", "Newfoundland"),
+    ("NS", "Nova Scotia"),
+    ("ON", "Ontario"),
+    ("PE", "PEI"),
+    ("QC", "Quebec"),
+    ("SK", "Saskatchewan"),
+    ("YT", "Yukon"),
+)
+
+def setup_logging() -> QueueListener:
+    """Set up detailed logging; records are handed to a background thread so
+    concurrent portal tests never block on file or console output"""
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler('portal_test_results.log')
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    # Only the message is rendered here; the listener's handlers add the rest
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    # force=True: importing main has already configured the root logger
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler], force=True)
+    
+    listener = QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    return listener
+
+
 class PortalTester:
     def __init__(self):
         self.scanner = ProcurementScanner()
-        self.results = {}
+        # Per-portal results kept as parallel arrays, one slot per tested portal
+        self._names = []
+        self._success = array.array('b')
+        self._tenders = array.array('i')
+        self._durations = array.array('d')
+        self._errors = []
+        # Caps how many portals are scraped at once
+        self._sem = asyncio.Semaphore(6)
         
-    async def test_portal(self, portal_name: str, scan_method, *args):
-        """Test a specific portal and return detailed results"""
-        start_time = time.time()
+    async def test_portal(self, portal_name: str, is_coroutine: bool, scan_method, *args):
+        """Test a specific portal and return detailed results
+
+        is_coroutine is resolved once when the test list is built, so the
+        scan method is not introspected on every call.
+        """
         tenders_found = 0
         error_message = None
         success = False
         
-        try:
-            logger.info(f"🚀 Testing {portal_name}...")
+        async with self._sem:
+            # Time the scan itself, not the wait for a free slot
+            start_time = time.time()
+            try:
+                logger.info(f"🚀 Testing {portal_name}...")
             
-            # Call the scan method
-            if asyncio.iscoroutinefunction(scan_method):
-                results = await scan_method(*args)
-            else:
-                results = scan_method(*args)
+                # Call the scan method
+                if is_coroutine:
+                    results = await scan_method(*args)
+                else:
+                    results = scan_method(*args)
             
-            # Process results
-            if isinstance(results, list):
-                tenders_found = len(results)
-                success = True
-                logger.info(f"✅ {portal_name}: Found {tenders_found} tenders")
-            else:
-                error_message = f"Unexpected result type: {type(results)}"
-                logger.error(f"❌ {portal_name}: {error_message}")
+                # Process results
+                if isinstance(results, list):
+                    tenders_found = len(results)
+                    success = True
+                    logger.info(f"✅ {portal_name}: Found {tenders_found} tenders")
+                else:
+                    error_message = f"Unexpected result type: {type(results)}"
+                    logger.error(f"❌ {portal_name}: {error_message}")
                 
-        except Exception as e:
-            error_message = str(e)
-            logger.error(f"❌ {portal_name}: Error - {error_message}")
-            logger.error(f"   Traceback: {traceback.format_exc()}")
+            except Exception as e:
+                error_message = str(e)
+                logger.error(f"❌ {portal_name}: Error - {error_message}")
+                logger.error(f"   Traceback: {traceback.format_exc()}")
         
         end_time = time.time()
         duration = end_time - start_time
@@ -91,48 +135,49 @@ class PortalTester:
             ("MERX Winnipeg", self.scanner.scan_bidsandtenders_portal, "MERX Winnipeg", "https://www.merx.com/gov/winnipeg/opportunities"),
             ("MERX Calgary", self.scanner.scan_bidsandtenders_portal, "MERX Calgary", "https://www.merx.com/gov/calgary/opportunities"),
             
-            # Bids&Tenders Regional Portals
-            ("Bids&Tenders Alberta", self.scanner.scan_bidsandtenders_portal, "Bids&Tenders Alberta", "https://www.bidsandtenders.ca/section/opportunities/opportunities.asp?type=1&show=all&rregion=AB"),
-            ("Bids&Tenders BC", self.scanner.scan_bidsandtenders_portal, "Bids&Tenders BC", "https://www.bidsandtenders.ca/section/opportunities/opportunities.asp?type=1&show=all&rregion=BC"),
-            ("Bids&Tenders Manitoba", self.scanner.scan_bidsandtenders_portal, "Bids&Tenders Manitoba", "https://www.bidsandtenders.ca/section/opportunities/opportunities.asp?type=1&show=all&rregion=MB"),
-            ("Bids&Tenders New Brunswick", self.scanner.scan_bidsandtenders_portal, "Bids&Tenders New Brunswick", "https://www.bidsandtenders.ca/section/opportunities/opportunities.asp?type=1&show=all&rregion=NB"),
-            ("Bids&Tenders Newfoundland", self.scanner.scan_bidsandtenders_portal, "Bids&Tenders Newfoundland", "https://www.bidsandtenders.ca/section/opportunities/opportunities.asp?type=1&show=all&rregion=NL"),
-            ("Bids&Tenders Nova Scotia", self.scanner.scan_bidsandtenders_portal, "Bids&Tenders Nova Scotia", "https://www.bidsandtenders.ca/section/opportunities/opportunities.asp?type=1&show=all&rregion=NS"),
-            ("Bids&Tenders Ontario", self.scanner.scan_bidsandtenders_portal, "Bids&Tenders Ontario", "https://www.bidsandtenders.ca/section/opportunities/opportunities.asp?type=1&show=all&rregion=ON"),
-            ("Bids&Tenders PEI", self.scanner.scan_bidsandtenders_portal, "Bids&Tenders PEI", "https://www.bidsandtenders.ca/section/opportunities/opportunities.asp?type=1&show=all&rregion=PE"),
-            ("Bids&Tenders Quebec", self.scanner.scan_bidsandtenders_portal, "Bids&Tenders Quebec", "https://www.bidsandtenders.ca/section/opportunities/opportunities.asp?type=1&show=all&rregion=QC"),
-            ("Bids&Tenders Saskatchewan", self.scanner.scan_bidsandtenders_portal, "Bids&Tenders Saskatchewan", "https://www.bidsandtenders.ca/section/opportunities/opportunities.asp?type=1&show=all&rregion=SK"),
-            ("Bids&Tenders Yukon", self.scanner.scan_bidsandtenders_portal, "Bids&Tenders Yukon", "https://www.bidsandtenders.ca/section/opportunities/opportunities.asp?type=1&show=all&rregion=YT"),
         ]
         
+        # Bids&Tenders Regional Portals
+        portal_tests.extend(
+            (f"Bids&Tenders {region_name}", self.scanner.scan_bidsandtenders_portal,
+             f"Bids&Tenders {region_name}", bidsandtenders_search_url(region))
+            for region, region_name in BIDSANDTENDERS_REGIONS
+        )
+        
         total_portals = len(portal_tests)
-        successful_portals = 0
-        total_tenders = 0
         
         logger.info(f"📊 Testing {total_portals} portals...")
         
-        for i, test in enumerate(portal_tests, 1):
+        tasks = [
+            self.test_portal(name, asyncio.iscoroutinefunction(method), method, *args)
+            for name, method, *args in portal_tests
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        for test, result in zip(portal_tests, results):
             portal_name = test[0]
-            scan_method = test[1]
-            args = test[2:] if len(test) > 2 else []
-            
-            logger.info(f"📋 [{i}/{total_portals}] Testing {portal_name}")
-            
-            result = await self.test_portal(portal_name, scan_method, *args)
-            self.results[portal_name] = result
-            
-            if result['success']:
-                successful_portals += 1
-                tenders_found = int(result['tenders_found'] or 0)
-                total_tenders += tenders_found
-            
-            # Small delay between tests to avoid overwhelming the system
-            await asyncio.sleep(2)
+            if isinstance(result, BaseException):
+                result = {
+                    'portal': portal_name,
+                    'success': False,
+                    'tenders_found': 0,
+                    'duration': 0.0,
+                    'error': str(result)
+                }
+            self._names.append(portal_name)
+            self._success.append(1 if result['success'] else 0)
+            self._tenders.append(int(result['tenders_found'] or 0))
+            self._durations.append(result['duration'])
+            self._errors.append(result['error'])
         
         # Print summary
-        self.print_summary(total_portals, successful_portals, total_tenders)
+        self.print_summary(total_portals, sum(self._success), sum(self._tenders))
         
-        return self.results
+        return self.iter_results()
+    
+    def iter_results(self):
+        """Yield (portal, success, tenders_found, duration, error) per tested portal"""
+        return zip(self._names, map(bool, self._success), self._tenders, self._durations, self._errors)
     
     def print_summary(self, total_portals, successful_portals, total_tenders):
         """Print comprehensive test summary"""
@@ -150,17 +195,14 @@ class PortalTester:
         logger.info("📋 DETAILED RESULTS:")
         logger.info("-" * 80)
         
-        for portal_name, result in self.results.items():
-            status = "✅" if result['success'] else "❌"
-            tenders = result['tenders_found']
-            duration = result['duration']
-            error = result['error'] if result['error'] else "None"
+        for portal_name, success, tenders, duration, error in self.iter_results():
+            status = "✅" if success else "❌"
             
             logger.info(f"{status} {portal_name}:")
             logger.info(f"   Tenders: {tenders}")
             logger.info(f"   Duration: {duration:.2f}s")
-            if not result['success']:
-                logger.info(f"   Error: {error}")
+            if not success:
+                logger.info(f"   Error: {error or 'None'}")
             logger.info("")
 
 async def main():
@@ -168,21 +210,26 @@ async def main():
     tester = PortalTester()
     results = await tester.run_all_tests()
     
-    # Save results to file
+    # Save results to file in a single write
+    lines = ["PORTAL TEST RESULTS", "=" * 50, ""]
+    for portal_name, success, tenders, duration, error in results:
+        lines.append(f"Portal: {portal_name}")
+        lines.append(f"Success: {success}")
+        lines.append(f"Tenders Found: {tenders}")
+        lines.append(f"Duration: {duration:.2f}s")
+        if error:
+            lines.append(f"Error: {error}")
+        lines.append("-" * 30)
+    
     with open('portal_test_results.txt', 'w') as f:
-        f.write("PORTAL TEST RESULTS\n")
-        f.write("=" * 50 + "\n\n")
-        
-        for portal_name, result in results.items():
-            f.write(f"Portal: {portal_name}\n")
-            f.write(f"Success: {result['success']}\n")
-            f.write(f"Tenders Found: {result['tenders_found']}\n")
-            f.write(f"Duration: {result['duration']:.2f}s\n")
-            if result['error']:
-                f.write(f"Error: {result['error']}\n")
-            f.write("-" * 30 + "\n")
+        f.write("\n".join(lines) + "\n")
     
     logger.info("💾 Results saved to portal_test_results.txt")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    log_listener = setup_logging()
+    try:
+        asyncio.run(main())
+    finally:
+        # Flush any queued records before the interpreter exits
+        log_listener.stop() 
\ No newline at end of file
@@ -1,7 +1,24 @@
 # config.py - Shared configuration and constants
 import os
-from typing import Dict, List
-from pydantic_settings import BaseSettings
+import re
+import sys
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+from pydantic import computed_field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# Prefer orjson for serialization when available (returns bytes directly)
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
 
 class Settings(BaseSettings):
     """Application settings using pydantic-settings for environment variable management"""
@@ -39,6 +56,12 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "your-secret-key-change-in-production"
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:8000"
     
+    @computed_field  # type: ignore[misc]
+    @cached_property
+    def cors_origins_list(self) -> FrozenSet[str]:
+        """CORS_ORIGINS parsed once into a set of origins"""
+        return frozenset(origin.strip() for origin in self.CORS_ORIGINS.split(',') if origin.strip())
+    
     # MERX Portal Credentials (optional)
     MERX_USERNAME: str = ""
     MERX_PASSWORD: str = ""
@@ -53,17 +76,22 @@ class Settings(BaseSettings):
     ENABLE_METRICS: bool = True
     PROMETHEUS_PORT: int = 9090
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False, frozen=True)
 
-# Create settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment on first use"""
+    return Settings()
 
-# Legacy compatibility - keep the original constants
-DATABASE_URL = settings.DATABASE_URL
-REDIS_URL = settings.REDIS_URL
-SELENIUM_HUB_URL = settings.SELENIUM_HUB_URL
+# Legacy compatibility - keep the original constants, resolved on first access
+_LEGACY_SETTINGS = ('DATABASE_URL', 'REDIS_URL', 'SELENIUM_HUB_URL')
+
+def __getattr__(name: str):
+    if name == 'settings':
+        return get_settings()
+    if name in _LEGACY_SETTINGS:
+        return getattr(get_settings(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Training courses for matching
 TKA_COURSES = [
@@ -78,8 +106,39 @@ TKA_COURSES = [
     "Environmental Management", "Sustainability", "Corporate Social Responsibility"
 ]
 
+TKA_COURSES_LOWER = tuple(sys.intern(course.lower()) for course in TKA_COURSES)
+TKA_COURSES_SET = frozenset(TKA_COURSES_LOWER)
+
+# Single alternation over every course, longest first; the lookahead lets
+# matches overlap so one pass over the text finds every course it mentions
+_TKA_COURSES_PATTERN = re.compile(
+    '(?=(' + '|'.join(re.escape(c) for c in sorted(TKA_COURSES_LOWER, key=len, reverse=True)) + '))'
+)
+
+def match_courses(text: str) -> List[str]:
+    """Return the TKA courses mentioned in text, in TKA_COURSES order"""
+    found = set(_TKA_COURSES_PATTERN.findall(text.lower()))
+    if not found:
+        return []
+    return [course for course, lower in zip(TKA_COURSES, TKA_COURSES_LOWER) if lower in found]
+
+@dataclass(frozen=True, slots=True)
+class PortalConfig:
+    """Read-only settings for a single procurement portal"""
+    name: str
+    type: str
+    url: str
+    priority: str
+    search_url: Optional[str] = None
+    requires_selenium: bool = False
+    region: Optional[str] = None
+    
+    def to_dict(self) -> Dict:
+        """Plain-dict copy for consumers that still expect the mapping form"""
+        return asdict(self)
+
 # Portal configurations
-PORTAL_CONFIGS = {
+_RAW_PORTAL_CONFIGS = {
     'canadabuys': {
         'name': 'CanadaBuys',
         'type': 'api',
@@ -209,41 +268,72 @@ PORTAL_CONFIGS = {
         'type': 'web',
         'url': 'https://www.ontariohealth.ca/procurement',
         'priority': 'medium'
-    },
-    # Bids&Tenders Platform Cities
-    'edmonton': {
-        'name': 'City of Edmonton',
-        'type': 'bidsandtenders',
-        'url': 'https://www.bidsandtenders.ca',
-        'search_url': 'https://www.bidsandtenders.ca/section/opportunities/opportunities.asp?type=1&show=all&rregion=AB',
-        'priority': 'medium'
-    },
-    'ottawa': {
-        'name': 'City of Ottawa',
-        'type': 'bidsandtenders',
-        'url': 'https://www.bidsandtenders.ca',
-        'search_url': 'https://www.bidsandtenders.ca/section/opportunities/opportunities.asp?type=1&show=all&rregion=ON',
-        'priority': 'medium'
-    },
-    'london': {
-        'name': 'City of London',
-        'type': 'bidsandtenders',
-        'url': 'https://www.bidsandtenders.ca',
-        'search_url': 'https://www.bidsandtenders.ca/section/opportunities/opportunities.asp?type=1&show=all&rregion=ON',
-        'priority': 'medium'
-    },
-    'hamilton': {
-        'name': 'City of Hamilton',
-        'type': 'bidsandtenders',
-        'url': 'https://www.bidsandtenders.ca',
-        'search_url': 'https://www.bidsandtenders.ca/section/opportunities/opportunities.asp?type=1&show=all&rregion=ON',
-        'priority': 'medium'
-    },
-    'kitchener': {
-        'name': 'City of Kitchener',
+    }
+}
+
+# Bids&Tenders search results filtered by province/territory code
+BIDSANDTENDERS_SEARCH_URL = "https://www.bidsandtenders.ca/section/opportunities/opportunities.asp?type=1&show=all&rregion={}"
+
+# Bids&Tenders Platform Cities: portal id -> (city name, region code)
+_BIDSANDTENDERS_CITIES = {
+    'edmonton': ('City of Edmonton', 'AB'),
+    'ottawa': ('City of Ottawa', 'ON'),
+    'london': ('City of London', 'ON'),
+    'hamilton': ('City of Hamilton', 'ON'),
+    'kitchener': ('City of Kitchener', 'ON'),
+}
+
+_RAW_PORTAL_CONFIGS.update({
+    portal_id: {
+        'name': city_name,
         'type': 'bidsandtenders',
         'url': 'https://www.bidsandtenders.ca',
-        'search_url': 'https://www.bidsandtenders.ca/section/opportunities/opportunities.asp?type=1&show=all&rregion=ON',
+        'region': region,
         'priority': 'medium'
     }
-} 
\ No newline at end of file
+    for portal_id, (city_name, region) in _BIDSANDTENDERS_CITIES.items()
+})
+
+@lru_cache(maxsize=None)
+def bidsandtenders_search_url(region: str) -> str:
+    """Bids&Tenders search URL for a region; cities sharing a region share one string"""
+    return BIDSANDTENDERS_SEARCH_URL.format(region)
+
+def _build_portal_config(raw: Dict) -> PortalConfig:
+    # type and priority are compared against literals throughout the scanners;
+    # interning lets those comparisons short-circuit on identity
+    fields = dict(raw)
+    fields['type'] = sys.intern(fields['type'])
+    fields['priority'] = sys.intern(fields['priority'])
+    if fields.get('region'):
+        fields['region'] = sys.intern(fields['region'])
+        fields.setdefault('search_url', bidsandtenders_search_url(fields['region']))
+    return PortalConfig(**fields)
+
+PORTAL_CONFIGS: Mapping[str, PortalConfig] = MappingProxyType(
+    {sys.intern(portal_id): _build_portal_config(raw) for portal_id, raw in _RAW_PORTAL_CONFIGS.items()}
+)
+
+# Portal registry pre-serialized once for Celery/Redis/HTTP payloads
+PORTAL_CONFIGS_JSON: bytes = _dumps({portal_id: config.to_dict() for portal_id, config in PORTAL_CONFIGS.items()})
+
+def _index_portals(attribute: str) -> Mapping[str, Tuple[str, ...]]:
+    index: Dict[str, List[str]] = defaultdict(list)
+    for portal_id, config in PORTAL_CONFIGS.items():
+        index[getattr(config, attribute)].append(portal_id)
+    return MappingProxyType({key: tuple(ids) for key, ids in index.items()})
+
+# Portal ids grouped by priority and by type, in PORTAL_CONFIGS order
+PORTALS_BY_PRIORITY = _index_portals('priority')
+PORTALS_BY_TYPE = _index_portals('type')
+
+def get_portals(priority: Optional[str] = None, type: Optional[str] = None) -> Tuple[str, ...]:
+    """Return portal ids matching the given priority and/or type, in PORTAL_CONFIGS order"""
+    if priority is None and type is None:
+        return tuple(PORTAL_CONFIGS)
+    if type is None:
+        return PORTALS_BY_PRIORITY.get(priority, ())
+    if priority is None:
+        return PORTALS_BY_TYPE.get(type, ())
+    same_type = set(PORTALS_BY_TYPE.get(type, ()))
+    return tuple(portal_id for portal_id in PORTALS_BY_PRIORITY.get(priority, ()) if portal_id in same_type)
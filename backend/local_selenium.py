@@ -1,4 +1,5 @@
 # local_selenium.py - Local Selenium setup without Grid
+import itertools
 import logging
 import time
 import random
@@ -7,54 +8,91 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     WebDriverException, 
     TimeoutException, 
     NoSuchElementException,
-    SessionNotCreatedException
+    SessionNotCreatedException,
+    InvalidSessionIdException
 )
-from typing import Optional, Any
+from typing import Optional, Any, Dict, List, Tuple
+from selenium_utils import DriverPool, find_many, presence_of, retry_backoff
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
 import os
+import shutil
 
 logger = logging.getLogger(__name__)
 
+# ChromeDriver location, resolved once: PATH first, then the usual install paths
+_CHROMEDRIVER_PATH = shutil.which('chromedriver') or next(
+    (path for path in ('/usr/bin/chromedriver', '/usr/local/bin/chromedriver') if os.path.isfile(path)),
+    None
+)
+
+# Chrome arguments shared by every local driver; only the user agent varies
+_BASE_CHROME_ARGS = (
+    # Essential headless options
+    '--headless',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--window-size=1920,1080',
+    # Anti-bot detection
+    '--disable-blink-features=AutomationControlled',
+    # Performance options
+    '--disable-extensions',
+    '--disable-plugins',
+)
+
+# Heavy resources the scrapers never read; blocked per driver over CDP
+_BLOCKED_URL_PATTERNS = (
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm', '*.mp3',
+)
+
+_EXPERIMENTAL_OPTIONS = (
+    ("excludeSwitches", ["enable-automation"]),
+    ('useAutomationExtension', False),
+)
+
+_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+_UA_CYCLE = itertools.cycle(_USER_AGENTS)
+
+# Minimum spacing between requests to one host, and the ceiling it may grow to
+_MIN_HOST_BACKOFF = 1.0
+_MAX_HOST_BACKOFF = 60.0
+
+@dataclass(slots=True)
+class HostState:
+    """Pacing state for one host visited by stealth_navigation"""
+    last_access: float
+    backoff: float = _MIN_HOST_BACKOFF
+
+@dataclass(slots=True)
 class LocalSeleniumManager:
     """Local Selenium manager without Grid dependency"""
     
-    def __init__(self):
-        self.max_retries = 3
-        self.retry_delay = 2
-        
+    max_retries: int = 3
+    retry_delay: int = 2
+    _host_state: Dict[str, HostState] = field(default_factory=dict, init=False, repr=False)
+    
     def get_chrome_options(self) -> Options:
         """Get Chrome options for local driver"""
         options = Options()
         
-        # Essential headless options
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--window-size=1920,1080')
+        for argument in _BASE_CHROME_ARGS:
+            options.add_argument(argument)
+        for name, value in _EXPERIMENTAL_OPTIONS:
+            options.add_experimental_option(name, value)
         
-        # Anti-bot detection
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        
-        # User agent rotation
-        user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        ]
-        options.add_argument(f'--user-agent={random.choice(user_agents)}')
-        
-        # Performance options
-        options.add_argument('--disable-extensions')
-        options.add_argument('--disable-plugins')
-        options.add_argument('--disable-images')
-        options.add_argument('--disable-javascript')  # Remove if JS is needed
+        # User agent rotation (round-robin across fingerprints)
+        options.add_argument(f'--user-agent={next(_UA_CYCLE)}')
         
         return options
     
@@ -64,44 +102,46 @@ class LocalSeleniumManager:
             try:
                 logger.info(f"Creating local Chrome driver (attempt {attempt + 1}/{max_attempts})")
                 
-                # Try different ChromeDriver paths
-                driver_paths = [
-                    '/usr/bin/chromedriver',
-                    '/usr/local/bin/chromedriver',
-                    'chromedriver'
-                ]
-                
-                service = None
-                for path in driver_paths:
-                    try:
-                        service = Service(path)
-                        break
-                    except Exception:
-                        continue
-                
-                if service is None:
+                if _CHROMEDRIVER_PATH is None:
                     logger.error("ChromeDriver not found in any expected location")
                     return None
                 
+                service = Service(_CHROMEDRIVER_PATH)
+                
                 options = self.get_chrome_options()
                 
                 # Try to create the driver
                 driver = webdriver.Chrome(service=service, options=options)
                 
+                self._block_heavy_resources(driver)
+                
                 # Test the driver
                 driver.get("data:text/html,<html><body>Test</body></html>")
                 logger.info("Local Chrome driver successfully created and tested")
                 return driver
                 
+            except SessionNotCreatedException as e:
+                # Locally this means a Chrome/ChromeDriver mismatch or a broken
+                # install, which no amount of retrying will fix
+                logger.error(f"Local Chrome session could not be created: {e}")
+                return None
             except Exception as e:
-                logger.warning(f"Local driver creation failed on attempt {attempt + 1}: {e}")
+                logger.warning(f"Local driver creation failed on attempt {attempt + 1} ({type(e).__name__}): {e}")
                 if attempt < max_attempts - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
+                    time.sleep(retry_backoff(self.retry_delay, attempt))
                 continue
         
         logger.error("Failed to create local Chrome driver after all attempts")
         return None
     
+    def _block_heavy_resources(self, driver: webdriver.Chrome) -> None:
+        """Stop the browser from downloading images, fonts and media"""
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(_BLOCKED_URL_PATTERNS)})
+        except Exception as e:
+            logger.warning(f"Could not set blocked URLs on driver: {e}")
+    
     def safe_quit_driver(self, driver: Optional[webdriver.Chrome]) -> None:
         """Safely quit WebDriver"""
         if driver:
@@ -112,46 +152,69 @@ class LocalSeleniumManager:
     
     def stealth_navigation(self, driver: webdriver.Chrome, url: str, max_attempts: int = 3) -> bool:
         """Navigate to URL with stealth measures"""
+        host = urlparse(url).netloc
         for attempt in range(max_attempts):
             try:
                 logger.info(f"Navigating to {url} (attempt {attempt + 1}/{max_attempts})")
                 
-                # Random delay
-                time.sleep(random.uniform(1, 3))
+                # Per-host pacing: no wait on a host's first request
+                self._wait_for_host(host)
                 
                 # Navigate
                 driver.get(url)
                 
-                # Wait for page load
-                WebDriverWait(driver, 30).until(
-                    lambda d: d.execute_script("return document.readyState") == "complete"
-                )
-                
-                # Additional delay
-                time.sleep(random.uniform(2, 5))
+                # With the default "normal" page load strategy, get() has already
+                # waited for the load event; poll only if the page isn't complete yet
+                if driver.execute_script("return document.readyState") != "complete":
+                    WebDriverWait(driver, 30).until(
+                        lambda d: d.execute_script("return document.readyState") == "complete"
+                    )
                 
+                self._host_state[host].backoff = max(
+                    _MIN_HOST_BACKOFF, self._host_state[host].backoff / 2
+                )
                 logger.info(f"Successfully navigated to {url}")
                 return True
                 
             except TimeoutException:
+                # Likely throttled or bot-walled: back off harder on this host;
+                # the wait is applied before the next attempt
                 logger.warning(f"Navigation timeout on attempt {attempt + 1}")
-                if attempt < max_attempts - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
+                state = self._host_state[host]
+                state.backoff = min(_MAX_HOST_BACKOFF, state.backoff * 2)
                 continue
+            except InvalidSessionIdException as e:
+                # The browser session is gone; retrying with it cannot succeed
+                logger.error(f"Navigation aborted, driver session is no longer valid: {e}")
+                return False
             except Exception as e:
-                logger.error(f"Navigation failed on attempt {attempt + 1}: {e}")
+                logger.error(f"Navigation failed on attempt {attempt + 1} ({type(e).__name__}): {e}")
                 if attempt < max_attempts - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
+                    time.sleep(retry_backoff(self.retry_delay, attempt))
                 continue
         
         logger.error(f"Failed to navigate to {url} after all attempts")
         return False
     
+    def _wait_for_host(self, host: str) -> None:
+        """Sleep until the host's backoff since its last request has elapsed"""
+        now = time.monotonic()
+        state = self._host_state.get(host)
+        if state is None:
+            self._host_state[host] = HostState(last_access=now)
+            return
+        
+        sleep_for = state.backoff - (now - state.last_access)
+        if sleep_for > 0:
+            # Jitter keeps the request spacing from looking mechanical
+            time.sleep(sleep_for * random.uniform(1.0, 1.5))
+        state.last_access = time.monotonic()
+    
     def find_element_safe(self, driver: webdriver.Chrome, by: str, value: str, timeout: int = 10) -> Optional[Any]:
         """Safely find element with timeout"""
         try:
             element = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((by, value))
+                presence_of(by, value)
             )
             return element
         except TimeoutException:
@@ -165,7 +228,7 @@ class LocalSeleniumManager:
         """Safely find elements with timeout"""
         try:
             WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((by, value))
+                presence_of(by, value)
             )
             elements = driver.find_elements(by, value)
             return elements
@@ -175,6 +238,15 @@ class LocalSeleniumManager:
         except Exception as e:
             logger.error(f"Error finding elements {by}={value}: {e}")
             return []
+    
+    def find_many(self, driver: webdriver.Chrome, queries: List[Tuple[str, str]], timeout: int = 10) -> List[list]:
+        """Find elements for several (by, value) queries in one browser round-trip
+        
+        Waits once until any query matches, then returns one list of elements per
+        query, in order. Supports By.CSS_SELECTOR, By.XPATH, By.ID, By.CLASS_NAME
+        and By.TAG_NAME.
+        """
+        return find_many(driver, queries, timeout)
 
 # Global local selenium manager instance
 local_selenium_manager = None
@@ -187,9 +259,28 @@ def get_local_selenium_manager() -> LocalSeleniumManager:
     return local_selenium_manager
 
 def get_local_driver():
-    """Get a local WebDriver instance"""
-    manager = get_local_selenium_manager()
-    driver = manager.create_driver()
+    """Borrow a local WebDriver from the pool; hand it back with get_local_driver_pool().release()"""
+    driver = get_local_driver_pool().checkout()
     if driver is None:
         raise RuntimeError("Failed to create local WebDriver")
-    return driver
\ No newline at end of file
+    return driver
+
+# Global local driver pool
+local_driver_pool = None
+
+def get_local_driver_pool() -> DriverPool:
+    """Get or create the local driver pool
+    
+    Sized by LOCAL_DRIVER_POOL_SIZE; LOCAL_DRIVER_POOL_WARM drivers are started up front.
+    """
+    global local_driver_pool
+    if local_driver_pool is None:
+        max_size = int(os.getenv('LOCAL_DRIVER_POOL_SIZE', '4'))
+        warm = int(os.getenv('LOCAL_DRIVER_POOL_WARM', '0'))
+        local_driver_pool = DriverPool(get_local_selenium_manager(), max_size=max_size, warm=warm)
+    return local_driver_pool
+
+def close_local_driver_pool() -> None:
+    """Quit the local pool's idle drivers, if the pool was ever created"""
+    if local_driver_pool is not None:
+        local_driver_pool.close()
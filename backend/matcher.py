@@ -2,7 +2,7 @@
 import logging
 from datetime import datetime
 from typing import Dict, List
-from config import TKA_COURSES
+from config import match_courses
 
 logger = logging.getLogger(__name__)
 
@@ -12,14 +12,7 @@ class TenderMatcher:
     @staticmethod
     def match_courses(tender: Dict) -> List[str]:
         """Match tender to relevant training courses"""
-        text = f"{tender.get('title', '')} {tender.get('description', '')}".lower()
-        matched_courses = []
-        
-        for course in TKA_COURSES:
-            if course.lower() in text:
-                matched_courses.append(course)
-        
-        return matched_courses
+        return match_courses(f"{tender.get('title', '')} {tender.get('description', '')}")
     
     @staticmethod
     def calculate_priority(tender: Dict) -> str:
@@ -74,4 +67,11 @@ class TenderMatcher:
         elif score >= 5:
             return 'medium'
         else:
-            return 'low' 
\ No newline at end of file
+            return 'low'
+    
+    @classmethod
+    def annotate(cls, tenders: List[Dict]) -> None:
+        """Set matching_courses and priority on each tender in place, before it is saved"""
+        for tender in tenders:
+            tender['matching_courses'] = cls.match_courses(tender)
+            tender['priority'] = cls.calculate_priority(tender)
@@ -1,12 +1,17 @@
 # models.py - Shared models and database functions
-from sqlalchemy import create_engine, Column, String, Float, DateTime, Text, Boolean, Integer, func
+from sqlalchemy import create_engine, event, Column, Index, String, Float, DateTime, Text, Boolean, Integer, func, insert, select, text, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import make_url
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.orm.decl_api import DeclarativeMeta
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime
+import asyncio
 import json
 import logging
-from typing import List, Dict, Optional, Any, TYPE_CHECKING
+from typing import List, Dict, AsyncIterator, Iterator, Optional, Any, Tuple, TYPE_CHECKING
 import hashlib
 
 from config import DATABASE_URL
@@ -16,11 +21,84 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Decode JSON columns with orjson when available; read paths decode every row's lists
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Database setup with environment variable support
-engine = create_engine(DATABASE_URL)
+_database_url = make_url(DATABASE_URL)
+if _database_url.get_backend_name() == 'postgresql':
+    # Sized for the API threadpool plus Celery scans; pre-ping and recycle drop
+    # connections Postgres closed while idle instead of failing the next request
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=20,
+        max_overflow=20,
+        pool_timeout=30,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        insertmanyvalues_page_size=1000,
+        json_deserializer=_json_loads,
+        **({'executemany_mode': 'values_plus_batch'} if _database_url.get_driver_name() == 'psycopg2' else {})
+    )
+
+    @event.listens_for(engine, 'connect')
+    def _configure_postgres_session(dbapi_connection, connection_record):
+        """Per-connection settings for short OLTP queries and re-scrapable tender writes
+        
+        synchronous_commit = off applies to every write made through this engine,
+        API and Celery alike: a crash can lose the last few hundred milliseconds of
+        commits, which holds no data a rescan cannot restore. The SETs run in
+        autocommit; inside the driver's implicit transaction the first rollback
+        (every pool checkin does one) would undo them.
+        """
+        autocommit = dbapi_connection.autocommit
+        dbapi_connection.autocommit = True
+        try:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("SET jit = off")
+            cursor.execute("SET synchronous_commit = off")
+            cursor.close()
+        finally:
+            dbapi_connection.autocommit = autocommit
+else:
+    engine = create_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base: Any = declarative_base()
 
+class JSONValue(TypeDecorator):
+    """JSON column holding Python lists/dicts: jsonb on PostgreSQL, JSON text elsewhere
+    
+    Values read back are already decoded. Tables created before the switch to
+    jsonb keep their text columns; their JSON strings are decoded on read, and
+    values that are not valid JSON come back as None. Comparisons use JSONB's
+    operators, so .contains() renders as @> and can use the GIN index.
+    """
+    impl = Text
+    cache_ok = True
+    comparator_factory = JSONB.Comparator
+    
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'postgresql':
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(Text())
+    
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name == 'postgresql':
+            return value
+        return json.dumps(value)
+    
+    def process_result_value(self, value, dialect):
+        if isinstance(value, str):
+            try:
+                return _json_loads(value)
+            except ValueError:
+                return None
+        return value
+
 class Tender(Base):
     __tablename__ = "tenders"
     
@@ -35,8 +113,8 @@ class Tender(Base):
     posted_date = Column(DateTime)
     description = Column(Text)
     location = Column(String)
-    categories = Column(Text)  # JSON string
-    keywords = Column(Text)  # JSON string
+    categories = Column(JSONValue)
+    keywords = Column(JSONValue)
     contact_email = Column(String)
     contact_phone = Column(String)
     tender_url = Column(String)
@@ -45,17 +123,184 @@ class Tender(Base):
     is_active = Column(Boolean, default=True)
     hash = Column(String)  # To detect changes
     priority = Column(String)
-    matching_courses = Column(Text)  # JSON string
+    matching_courses = Column(JSONValue)
     download_count = Column(Integer, default=0)
-    attachments = Column(Text)  # JSON string of attachment info
+    attachments = Column(JSONValue)  # attachment info
+    
+    __table_args__ = (
+        # Containment lookups such as Tender.keywords.contains(['pmp']); jsonb only
+        Index('ix_tenders_keywords_gin', 'keywords', postgresql_using='gin',
+              postgresql_ops={'keywords': 'jsonb_path_ops'}).ddl_if(dialect='postgresql'),
+    )
+
+# Partial indexes over active tenders, the only rows the API and reminder tasks
+# read: closing-soon windows, totals and per-portal sums, and the newest-first list
+_ACTIVE_TENDER_INDEXES = (
+    Index('ix_tenders_active_closing', Tender.closing_date,
+          postgresql_where=Tender.is_active, sqlite_where=Tender.is_active == True),
+    Index('ix_tenders_active_portal_value', Tender.portal, Tender.value,
+          postgresql_where=Tender.is_active, sqlite_where=Tender.is_active == True),
+    Index('ix_tenders_active_posted', Tender.posted_date,
+          postgresql_where=Tender.is_active, sqlite_where=Tender.is_active == True),
+)
+
+def ensure_indexes() -> None:
+    """Create the active-tender indexes on tables that create_all found already existing"""
+    for index in _ACTIVE_TENDER_INDEXES:
+        index.create(bind=engine, checkfirst=True)
+
+@contextmanager
+def portal_scan_lock(portal: str) -> Iterator[bool]:
+    """Claim one portal's scan across processes; yields False if another process holds it
+    
+    Uses a PostgreSQL session advisory lock keyed on the portal's PORTAL_CONFIGS id
+    (lowercased), so API and Celery scans of the same portal skip each other. The
+    lock lives on a dedicated autocommit connection for the duration of the block.
+    Other databases, or a failed connection or lock query, always yield True.
+    """
+    if engine.dialect.name != 'postgresql':
+        yield True
+        return
+    
+    key = f"scan:{portal.lower()}"
+    connection = None
+    try:
+        connection = engine.connect().execution_options(isolation_level='AUTOCOMMIT')
+        acquired = bool(connection.scalar(text("SELECT pg_try_advisory_lock(hashtext(:key))"), {'key': key}))
+    except Exception as e:
+        logger.warning(f"Could not take scan lock for {portal}, scanning without it: {e}")
+        if connection is not None:
+            connection.close()
+        yield True
+        return
+    with connection:
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                try:
+                    connection.execute(text("SELECT pg_advisory_unlock(hashtext(:key))"), {'key': key})
+                except Exception as e:
+                    # Never hand a connection still holding the lock back to the pool
+                    logger.warning(f"Could not release scan lock for {portal}: {e}")
+                    connection.invalidate()
+
+@asynccontextmanager
+async def async_portal_scan_lock(portal: str) -> AsyncIterator[bool]:
+    """portal_scan_lock for event-loop code: the blocking connect, lock and unlock run in a worker thread"""
+    lock = portal_scan_lock(portal)
+    acquired = await asyncio.to_thread(lock.__enter__)
+    try:
+        yield acquired
+    finally:
+        # The lock's own finally releases it; the block's exception, if any, propagates from here
+        await asyncio.to_thread(lock.__exit__, None, None, None)
+
+# Tender ids per IN (...) lookup, well under SQLite's bound-parameter limit
+_LOOKUP_CHUNK_SIZE = 500
+
+# Scraped fields that make up a tender's content. Scrape-time values such as
+# posted_date (often utcnow()) and relevance scores are left out, so an unchanged
+# tender hashes the same on every scan and is not rewritten. So are priority and
+# matching_courses, which are derived from these fields by whichever process saves.
+_HASHED_FIELDS = (
+    'title', 'organization', 'portal', 'portal_url', 'value', 'closing_date',
+    'description', 'location', 'categories', 'keywords', 'tender_url',
+    'documents_url',
+)
+
+def _content_hash(tender_data: Dict) -> str:
+    """Hash of a tender's scraped content, used to detect changes"""
+    # A fixed field order needs no key sorting; the stdlib encoder keeps hashes
+    # identical whether or not the optional orjson is installed
+    return hashlib.blake2b(
+        json.dumps([tender_data.get(field) for field in _HASHED_FIELDS], default=str).encode(),
+        digest_size=16
+    ).hexdigest()
+
+def _tender_values(tender_data: Dict, content_hash: str) -> Dict:
+    """Column values written when a tender is inserted or its content changes"""
+    return {
+        'tender_id': tender_data['tender_id'],
+        'title': tender_data['title'],
+        'organization': tender_data['organization'],
+        'portal': tender_data['portal'],
+        'portal_url': tender_data.get('portal_url', ''),
+        'value': tender_data['value'],
+        'closing_date': tender_data['closing_date'],
+        'description': tender_data['description'],
+        'location': tender_data.get('location', ''),
+        'categories': tender_data.get('categories', []),
+        'keywords': tender_data.get('keywords', []),
+        'tender_url': tender_data['tender_url'],
+        'documents_url': tender_data.get('documents_url', ''),
+        'hash': content_hash,
+        'priority': tender_data.get('priority', ''),
+        'matching_courses': tender_data.get('matching_courses', [])
+    }
+
+def save_tenders_to_db(db: Session, tenders: List[Dict]) -> Tuple[int, int]:
+    """Save a batch of tenders in one transaction, return (new, updated) counts.
+
+    Existing hashes are fetched with one query per chunk of ids, then new tenders
+    go in as a single executemany INSERT and changed ones as a single UPDATE by
+    primary key. Counts follow save_tender_to_db: every tender that is not new
+    counts as updated. If the batch fails, it is retried row by row.
+    """
+    rows: Dict[str, Dict] = {}
+    for tender_data in tenders:
+        try:
+            values = _tender_values(tender_data, _content_hash(tender_data))
+            values['posted_date'] = tender_data.get('posted_date', datetime.utcnow())
+            rows[tender_data['tender_id']] = values
+        except Exception as e:
+            logger.error(f"Error saving tender {tender_data.get('tender_id', 'unknown')}: {e}")
+    if not rows:
+        return 0, len(tenders)
+
+    try:
+        tender_ids = list(rows)
+        existing = {}
+        for start in range(0, len(tender_ids), _LOOKUP_CHUNK_SIZE):
+            existing.update(
+                (tender_id, (pk, current_hash))
+                for pk, tender_id, current_hash in db.execute(
+                    select(Tender.id, Tender.tender_id, Tender.hash)
+                    .where(Tender.tender_id.in_(tender_ids[start:start + _LOOKUP_CHUNK_SIZE]))
+                )
+            )
+
+        now = datetime.utcnow()
+        new_rows = []
+        changed_rows = []
+        for tender_id, values in rows.items():
+            if tender_id not in existing:
+                new_rows.append({'id': tender_id, **values})
+                continue
+            pk, current_hash = existing[tender_id]
+            if current_hash is not None and current_hash != values['hash']:
+                values.pop('posted_date')
+                changed_rows.append({'id': pk, **values, 'last_updated': now})
+
+        if new_rows:
+            db.execute(insert(Tender), new_rows)
+        if changed_rows:
+            db.execute(update(Tender), changed_rows)
+        db.commit()
+    except Exception as e:
+        logger.error(f"Bulk save of {len(rows)} tenders failed, saving one at a time: {e}")
+        db.rollback()
+        new_count = sum(save_tender_to_db(db, tender_data) for tender_data in tenders)
+        return new_count, len(tenders) - new_count
+
+    logger.info(f"Saved tenders: {len(new_rows)} new, {len(changed_rows)} changed, {len(rows) - len(new_rows) - len(changed_rows)} unchanged")
+    return len(new_rows), len(tenders) - len(new_rows)
 
 def save_tender_to_db(db: Session, tender_data: Dict) -> bool:
     """Save tender to database, return True if new, False if updated"""
     try:
         # Generate hash for change detection
-        content_hash = hashlib.md5(
-            json.dumps(tender_data, sort_keys=True, default=str).encode()
-        ).hexdigest()
+        content_hash = _content_hash(tender_data)
         
         # Check if tender already exists
         existing_tender = db.query(Tender).filter(
@@ -69,19 +314,19 @@ def save_tender_to_db(db: Session, tender_data: Dict) -> bool:
                 existing_tender.title = tender_data['title']
                 existing_tender.organization = tender_data['organization']
                 existing_tender.portal = tender_data['portal']
-                existing_tender.portal_url = tender_data['portal_url']
+                existing_tender.portal_url = tender_data.get('portal_url', '')
                 existing_tender.value = tender_data['value']
                 existing_tender.closing_date = tender_data['closing_date']
                 existing_tender.description = tender_data['description']
                 existing_tender.location = tender_data['location']
-                existing_tender.categories = json.dumps(tender_data.get('categories', []))
-                existing_tender.keywords = json.dumps(tender_data.get('keywords', []))
+                existing_tender.categories = tender_data.get('categories', [])
+                existing_tender.keywords = tender_data.get('keywords', [])
                 existing_tender.tender_url = tender_data['tender_url']
                 existing_tender.documents_url = tender_data.get('documents_url', '')
                 existing_tender.last_updated = datetime.utcnow()
                 existing_tender.hash = content_hash
                 existing_tender.priority = tender_data.get('priority', '')
-                existing_tender.matching_courses = json.dumps(tender_data.get('matching_courses', []))
+                existing_tender.matching_courses = tender_data.get('matching_courses', [])
                 
                 db.commit()
                 logger.info(f"Updating tender: {tender_data['tender_id']}")
@@ -95,19 +340,19 @@ def save_tender_to_db(db: Session, tender_data: Dict) -> bool:
             title=tender_data['title'],
             organization=tender_data['organization'],
             portal=tender_data['portal'],
-            portal_url=tender_data['portal_url'],
+            portal_url=tender_data.get('portal_url', ''),
             value=tender_data['value'],
             closing_date=tender_data['closing_date'],
             posted_date=tender_data.get('posted_date', datetime.utcnow()),
             description=tender_data['description'],
             location=tender_data.get('location', ''),
-            categories=json.dumps(tender_data.get('categories', [])),
-            keywords=json.dumps(tender_data.get('keywords', [])),
+            categories=tender_data.get('categories', []),
+            keywords=tender_data.get('keywords', []),
             tender_url=tender_data['tender_url'],
             documents_url=tender_data.get('documents_url', ''),
             hash=content_hash,
             priority=tender_data.get('priority', ''),
-            matching_courses=json.dumps(tender_data.get('matching_courses', []))
+            matching_courses=tender_data.get('matching_courses', [])
         )
         
         db.add(new_tender)
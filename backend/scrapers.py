@@ -2,47 +2,149 @@
 import logging
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 import pandas as pd
 import asyncio
+import aiohttp
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 import hashlib
 
+from selenium_utils import read_element, wait_for_any, wait_for_page_change, wait_until_gone
+
 logger = logging.getLogger(__name__)
 
+# lxml's C parser builds BeautifulSoup trees several times faster than the pure-Python
+# html.parser, which remains the fallback where lxml is not installed
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# ijson parses JSON API responses as they stream in; without it bodies are decoded whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Patterns used while parsing every scraped tender, compiled once
+_NON_NUMERIC_RE = re.compile(r'[^0-9.]+')
+_NUMBER_RE = re.compile(r'[\d,]+')
+_URL_NUMERIC_ID_RE = re.compile(r'/(\d+)(?:/|$)')
+_TITLE_NUMBER_RE = re.compile(r'#(\d+)')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_CLOSING_DATE_RE = re.compile(r'Closing[:\s]+([A-Za-z]+ \d+, \d{4})')
+_MANITOBA_TENDER_LINK_RE = re.compile(r'/tenders/tender_')
+_PEI_TRAINING_RE = re.compile('training|education|development|professional')
+
+def _class_strainer(name: str, css_class: str) -> SoupStrainer:
+    # While parsing, a strainer sees the raw class string ("row odd"), so match the
+    # class as one whitespace-separated token the way find_all(class_=...) does
+    return SoupStrainer(name, class_=re.compile(rf'(?:^|\s){re.escape(css_class)}(?:\s|$)'))
+
+# Only the elements each listing parser reads are built into the tree; the rest of
+# the page is skipped while parsing
+_ALBERTA_STRAINER = SoupStrainer('table', id='ContentPlaceHolder1_GridView1')
+_SASKATCHEWAN_STRAINER = _class_strainer('div', 'tender-result')
+_MANITOBA_STRAINER = SoupStrainer('a', href=_MANITOBA_TENDER_LINK_RE)
+_ONTARIO_STRAINER = _class_strainer('div', 'tender-item')
+_NOVA_SCOTIA_STRAINER = SoupStrainer('table', id='ctl00_ContentPlaceHolder1_gvTenders')
+_TENDER_ROW_STRAINER = _class_strainer('tr', 'tender-row')
+_CALGARY_STRAINER = _class_strainer('div', 'opportunity')
+_WINNIPEG_STRAINER = _class_strainer('table', 'bidopptable')
+_VANCOUVER_STRAINER = SoupStrainer('table', id='BUYER_SOURCING_SEARCH')
+_REGINA_STRAINER = _class_strainer('div', 'opportunity-item')
+_NBON_STRAINER = _class_strainer('div', 'opportunity-listing')
+_PEI_STRAINER = _class_strainer('li', 'search-result')
+_NL_STRAINER = _class_strainer('div', 'tender-list')
+_BUYBC_STRAINER = _class_strainer('div', 'tender-card')
+_ONTARIO_HEALTH_STRAINER = _class_strainer('div', 'row')
+_OPPORTUNITY_CARD_STRAINER = SoupStrainer(class_=re.compile(r'(?:^|\s)(?:opportunity|bid-item)(?:\s|$)'))
+
+def _make_soup(html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse a results page with the fastest available parser, optionally only the strained elements"""
+    return BeautifulSoup(html, _HTML_PARSER, parse_only=parse_only)
+
+# Formats tried in order when a date string is not plain ISO 8601
+_DATE_FORMATS = (
+    '%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y-%m-%d %H:%M:%S',
+    '%d-%b-%Y', '%d %b %Y', '%B %d, %Y', '%d %B %Y',
+    '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%SZ', '%d-%m-%Y',
+    '%b %d, %Y', '%d %b %Y %I:%M %p'
+)
+
+def _formats_by_lead(formats):
+    """Group strptime formats by how a matching string must start, keeping their order"""
+    groups = {'name': [], 'year': [], 'number': []}
+    for fmt in formats:
+        lead = 'name' if fmt[:2] in ('%b', '%B') else 'year' if fmt.startswith('%Y') else 'number'
+        groups[lead].append(fmt)
+    return {lead: tuple(group) for lead, group in groups.items()}
+
+def _date_lead(date_str: str) -> str:
+    # A month name, a 4-digit %Y or a 1-2 digit %d/%m: no string can match formats
+    # from more than one group, so only its own group is tried
+    if date_str[:1].isalpha():
+        return 'name'
+    if date_str[:4].isdecimal():
+        return 'year'
+    return 'number'
+
+_DATE_FORMATS_BY_LEAD = _formats_by_lead(_DATE_FORMATS)
+
 def parse_date(date_str: str) -> Optional[datetime]:
     """Parse date from various formats"""
     if not date_str:
         return None
-        
-    date_str = str(date_str).strip()
-    
-    # Common formats
-    formats = [
-        '%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y-%m-%d %H:%M:%S',
-        '%d-%b-%Y', '%d %b %Y', '%B %d, %Y', '%d %B %Y',
-        '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%SZ', '%d-%m-%Y',
-        '%b %d, %Y', '%d %b %Y %I:%M %p'
-    ]
+    return _parse_date_text(str(date_str).strip())
+
+@lru_cache(maxsize=4096)
+def _parse_date_text(date_str: str) -> Optional[datetime]:
+    # Listings repeat the same handful of dates, hence the cache. Naive ISO 8601
+    # strings take the C fromisoformat path; anything else tries the known formats
+    # it could match before the much slower pandas autodetection.
+    try:
+        parsed = datetime.fromisoformat(date_str)
+        if parsed.tzinfo is None:
+            return parsed
+    except ValueError:
+        pass
     
-    for fmt in formats:
+    for fmt in _DATE_FORMATS_BY_LEAD[_date_lead(date_str)]:
         try:
             return datetime.strptime(date_str, fmt)
-        except:
+        except ValueError:
             continue
             
     try:
         return pd.to_datetime(date_str, errors='coerce')
-    except:
+    except Exception:
         return None
 
+# Date formats shown on MERX/Biddingo listing cards
+_CARD_DATE_FORMATS = ('%B %d, %Y', '%b %d, %Y', '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y')
+_CARD_DATE_FORMATS_BY_LEAD = _formats_by_lead(_CARD_DATE_FORMATS)
+
+@lru_cache(maxsize=1024)
+def _parse_card_date(date_text: str) -> Optional[str]:
+    """ISO 8601 string for a listing card date, or None if no known format matches"""
+    for fmt in _CARD_DATE_FORMATS_BY_LEAD[_date_lead(date_text)]:
+        try:
+            return datetime.strptime(date_text, fmt).isoformat()
+        except ValueError:
+            continue
+    return None
+
 def parse_value(value_str: str) -> float:
     """Parse monetary value from string"""
     if not value_str:
@@ -50,15 +152,428 @@ def parse_value(value_str: str) -> float:
         
     value_str = str(value_str)
     
-    # Remove currency symbols and text
-    value_str = re.sub(r'[^0-9.,]', '', value_str)
-    value_str = value_str.replace(',', '')
+    # Remove currency symbols, text and thousands separators in one pass
+    value_str = _NON_NUMERIC_RE.sub('', value_str)
     
     try:
         return float(value_str)
-    except:
+    except ValueError:
         return 0.0
 
+def _parse_card_value(value_text: str) -> int:
+    """Whole-dollar value of a listing card amount such as "$250K", or 0"""
+    # Extract numbers and handle currency
+    match = _NUMBER_RE.search(value_text.replace(',', ''))
+    if match is None:
+        return 0
+    try:
+        value = float(match.group())
+    except ValueError:
+        return 0
+    
+    # Handle multipliers (K, M, B)
+    upper = value_text.upper()
+    if 'K' in upper:
+        value *= 1000
+    elif 'M' in upper:
+        value *= 1000000
+    elif 'B' in upper:
+        value *= 1000000000
+    
+    return int(value)
+
+def create_http_session() -> aiohttp.ClientSession:
+    """ClientSession for the plain HTTP scrapers: pooled keep-alive connections, cached DNS, bounded time"""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, limit_per_host=8, ttl_dns_cache=300, enable_cleanup_closed=True),
+        timeout=aiohttp.ClientTimeout(total=120)
+    )
+
+async def iter_json_items(response: aiohttp.ClientResponse, key: str, limit: int):
+    """Yield up to limit items of the list under a JSON response's top-level key.
+
+    With ijson only one item is held in memory at a time and the body stops being read
+    once limit items are out; otherwise the whole payload is decoded first.
+    """
+    if ijson is None:
+        data = await response.json()
+        for item in data.get(key, [])[:limit]:
+            yield item
+        return
+
+    if limit <= 0:
+        return
+    count = 0
+    async for item in ijson.items_async(response.content, f'{key}.item', use_float=True):
+        yield item
+        count += 1
+        if count >= limit:
+            return
+
+def read_opportunity_cards(html: str, base_url: str, limit: int) -> List[tuple]:
+    """(title, absolute url) of up to limit .opportunity/.bid-item cards in a listing page.
+
+    The static-HTML counterpart of reading the cards through Selenium; cards without a
+    title or link are skipped.
+    """
+    soup = _make_soup(html, _OPPORTUNITY_CARD_STRAINER)
+    cards = []
+    for card in soup.select(".opportunity, .bid-item", limit=limit):
+        title_elem = card.select_one(".title, h3")
+        link = card.select_one("a")
+        if title_elem is None or link is None or not link.get('href'):
+            continue
+        cards.append((title_elem.get_text().strip(), urljoin(base_url, link['href'])))
+    return cards
+
+def keyword_finder(keywords):
+    """Build a function returning the set of keywords that occur as substrings of a text.
+
+    A single lookahead alternation (longest keyword first) scans the text once; keywords
+    contained in a longer hit at the same offset are added back, so the result is exactly
+    {kw for kw in keywords if kw in text}.
+    """
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(re.escape(kw) for kw in ordered) + '))')
+    contained = {kw: frozenset(k for k in ordered if k in kw) for kw in ordered}
+
+    def find(text):
+        found = set()
+        for hit in set(pattern.findall(text)):
+            found |= contained[hit]
+        return found
+
+    return find
+
+# Keyword tables for the MERX and CanadaBuys card parsers
+_CARD_HIGH_PRIORITY_TERMS = (
+    'training', 'professional development', 'certification',
+    'AWS', 'Azure', 'cybersecurity', 'project management',
+    'agile', 'scrum', 'leadership', 'coaching'
+)
+_CARD_MEDIUM_PRIORITY_TERMS = (
+    'consulting', 'implementation', 'change management',
+    'development', 'education', 'learning'
+)
+_CARD_COURSE_MAPPINGS = (
+    ('aws', 'AWS Training'),
+    ('azure', 'Azure Training'),
+    ('cloud', 'Cloud Computing'),
+    ('cybersecurity', 'Cybersecurity Training'),
+    ('cissp', 'CISSP Certification'),
+    ('project management', 'Project Management'),
+    ('pmp', 'PMP Certification'),
+    ('prince2', 'PRINCE2 Certification'),
+    ('agile', 'Agile Training'),
+    ('scrum', 'Scrum Training'),
+    ('leadership', 'Leadership Development'),
+    ('itil', 'ITIL Training'),
+    ('devops', 'DevOps Training'),
+    ('data analytics', 'Data Analytics'),
+    ('business intelligence', 'Business Intelligence'),
+    ('change management', 'Change Management'),
+    ('coaching', 'Executive Coaching')
+)
+_CARD_RELEVANT_WORDS = (
+    'training', 'development', 'consulting', 'implementation',
+    'management', 'leadership', 'technology', 'digital',
+    'transformation', 'change', 'process', 'system'
+)
+
+_find_card_high_priority = keyword_finder(_CARD_HIGH_PRIORITY_TERMS)
+_find_card_medium_priority = keyword_finder(_CARD_MEDIUM_PRIORITY_TERMS)
+_find_card_courses = keyword_finder(kw for kw, _ in _CARD_COURSE_MAPPINGS)
+# Whole words only, equivalent to filtering re.findall(r'\b\w{4,}\b') against the list
+_CARD_RELEVANT_WORDS_PATTERN = re.compile(r'\b(' + '|'.join(_CARD_RELEVANT_WORDS) + r')\b')
+
+# Keyword tables for the Bids&Tenders and Biddingo element parsers
+_ELEMENT_TRAINING_KEYWORDS = (
+    'training', 'education', 'learning', 'development', 'workshop',
+    'seminar', 'course', 'certification', 'professional development',
+    'skill development', 'capacity building', 'upskilling', 'reskilling'
+)
+_ELEMENT_COURSE_MAPPING = (
+    ('project management', 'Project Management'),
+    ('leadership', 'Leadership'),
+    ('communication', 'Communication'),
+    ('negotiation', 'Negotiation'),
+    ('contract management', 'Contract Management'),
+    ('procurement', 'Procurement'),
+    ('supply chain', 'Supply Chain'),
+    ('risk management', 'Risk Management'),
+    ('strategic planning', 'Strategic Planning'),
+    ('change management', 'Change Management'),
+    ('team building', 'Team Building'),
+    ('conflict resolution', 'Conflict Resolution'),
+    ('time management', 'Time Management'),
+    ('problem solving', 'Problem Solving'),
+    ('decision making', 'Decision Making'),
+    ('financial management', 'Financial Management'),
+    ('human resources', 'Human Resources'),
+    ('marketing', 'Marketing'),
+    ('sales', 'Sales'),
+    ('customer service', 'Customer Service'),
+    ('quality management', 'Quality Management'),
+    ('process improvement', 'Process Improvement'),
+    ('innovation', 'Innovation'),
+    ('digital transformation', 'Digital Transformation'),
+    ('data analysis', 'Data Analysis'),
+    ('business intelligence', 'Business Intelligence'),
+    ('cybersecurity', 'Cybersecurity'),
+    ('cloud computing', 'Cloud Computing'),
+    ('agile', 'Agile'),
+    ('scrum', 'Scrum'),
+    ('lean six sigma', 'Lean Six Sigma'),
+    ('iso', 'ISO Standards'),
+    ('compliance', 'Compliance'),
+    ('regulatory', 'Regulatory Affairs')
+)
+_ELEMENT_HIGH_PRIORITY = (
+    'training', 'education', 'learning', 'development', 'workshop',
+    'seminar', 'course', 'certification', 'professional development',
+    'consulting', 'advisory', 'implementation', 'change management'
+)
+_ELEMENT_MEDIUM_PRIORITY = (
+    'service', 'support', 'maintenance', 'management', 'administration',
+    'coordination', 'facilitation', 'delivery', 'provision'
+)
+
+_find_element_training = keyword_finder(_ELEMENT_TRAINING_KEYWORDS)
+_find_element_courses = keyword_finder(kw for kw, _ in _ELEMENT_COURSE_MAPPING)
+_ELEMENT_HIGH_PRIORITY_PATTERN = re.compile('|'.join(map(re.escape, _ELEMENT_HIGH_PRIORITY)))
+_ELEMENT_MEDIUM_PRIORITY_PATTERN = re.compile('|'.join(map(re.escape, _ELEMENT_MEDIUM_PRIORITY)))
+
+@lru_cache(maxsize=64)
+def _query_terms(query: str) -> tuple:
+    """Lowercased terms of a search query"""
+    return tuple(query.lower().split())
+
+def _card_relevance(tender: Dict, query: str) -> float:
+    """Relevance of a MERX/CanadaBuys card to a search query, capped at 1.0"""
+    title = tender.get('title', '').lower()
+    description = tender.get('description', '').lower()
+    
+    score = 0
+    for term in _query_terms(query):
+        in_title = term in title
+        in_description = term in description
+        if in_title:
+            score += 0.5
+        if in_description:
+            score += 0.3
+        # Partial matches: a query term holds no whitespace, so it lies inside one
+        # of the text's words exactly when it occurs in the text at all
+        if in_title:
+            score += 0.2
+        if in_description:
+            score += 0.1
+    
+    return min(score, 1.0)
+
+def _card_priority(text: str) -> str:
+    """Priority for a lowercased MERX/CanadaBuys title + description"""
+    high_count = len(_find_card_high_priority(text))
+    if high_count >= 2:
+        return 'high'
+    if high_count >= 1 or len(_find_card_medium_priority(text)) >= 2:
+        return 'medium'
+    return 'low'
+
+def _card_courses(text: str) -> List[str]:
+    """Matching TKA courses for a lowercased MERX/CanadaBuys title + description"""
+    found = _find_card_courses(text)
+    if not found:
+        return []
+    return [course for keyword, course in _CARD_COURSE_MAPPINGS if keyword in found]
+
+def _card_keywords(text: str) -> List[str]:
+    """Relevant words in a lowercased MERX/CanadaBuys title + description, in first-seen order"""
+    return list(dict.fromkeys(_CARD_RELEVANT_WORDS_PATTERN.findall(text)))[:10]
+
+def _element_keywords(text: str) -> List[str]:
+    """Training keywords in a lowercased Bids&Tenders/Biddingo title + description"""
+    found = _find_element_training(text)
+    if not found:
+        return []
+    return [keyword for keyword in _ELEMENT_TRAINING_KEYWORDS if keyword in found]
+
+def _element_courses(text: str) -> List[str]:
+    """Matching TKA courses for a lowercased Bids&Tenders/Biddingo title + description"""
+    found = _find_element_courses(text)
+    if not found:
+        return []
+    return [course for keyword, course in _ELEMENT_COURSE_MAPPING if keyword in found]
+
+def _element_priority(text: str) -> str:
+    """Priority for a lowercased Bids&Tenders/Biddingo title + description"""
+    if _ELEMENT_HIGH_PRIORITY_PATTERN.search(text):
+        return 'high'
+    if _ELEMENT_MEDIUM_PRIORITY_PATTERN.search(text):
+        return 'medium'
+    return 'low'
+
+# Field lookups for a MERX/CanadaBuys result card, all resolved by read_element in
+# one round trip. Fallback lists are tried in order, as find_element calls were.
+_CARD_FIRST_QUERIES = {
+    'title': (
+        "h3 a", ".tender-title a", "h2 a", "h1 a",
+        ".title a", ".name a", ".heading a",
+        "a[href*='tender']", "a[href*='opportunity']", "a[href*='bid']",
+        "a", ".title", ".name", ".heading"
+    ),
+    'organization': (
+        ".organization", ".buyer-name", ".buyer", ".department",
+        ".agency", ".client", ".company", ".org",
+        "[class*='organization']", "[class*='buyer']", "[class*='department']"
+    ),
+    'location': (
+        ".location", ".province", ".region", ".area",
+        ".city", ".state", ".territory",
+        "[class*='location']", "[class*='province']", "[class*='region']"
+    ),
+    'closing_date': (".closing-date, .deadline, .due-date, [class*='closing'], [class*='deadline']",),
+    'posted_date': (".posted-date, .published-date, .issue-date, [class*='posted'], [class*='published']",),
+    'value': (".value, .budget, .amount",),
+    'description': (".description, .summary, .details",),
+}
+_CARD_EVERY_QUERIES = {
+    'categories': ".category, .tag, .classification",
+    'contacts': ".contact, .contact-info, .buyer-contact",
+}
+
+def _first_text(matches) -> str:
+    """Stripped text of the first non-empty match, or ''"""
+    for match in matches:
+        if match and match['text']:
+            return match['text']
+    return ""
+
+def _read_card_fields(card) -> Dict:
+    """Raw text fields of a MERX/CanadaBuys result card"""
+    # The card's own text is only a fallback title, so only its head is read
+    card_data = read_element(card, _CARD_FIRST_QUERIES, _CARD_EVERY_QUERIES, root_text_limit=200)
+    first = card_data['first']
+    
+    # Title and link: displayed matches in selector order, stopping at the first
+    # with both; otherwise the last displayed match wins
+    title = ""
+    tender_url = ""
+    for selector, match in zip(_CARD_FIRST_QUERIES['title'], first['title']):
+        if match and match['displayed']:
+            title = match['text']
+            tender_url = match['href'] or ""
+            if title and tender_url:
+                logger.info(f"Found title with selector: {selector}")
+                break
+    
+    if not title:
+        # Fallback: get any text that might be a title
+        title = card_data['root']['text'][:200].strip()  # First 200 chars as title
+        tender_url = card_data['root']['href'] or ""
+    
+    # Contact details from the last contact block that has them
+    email = None
+    phone = None
+    for text in card_data['every']['contacts']:
+        email_match = _EMAIL_RE.search(text)
+        if email_match:
+            email = email_match.group(0)
+        phone_match = _PHONE_RE.search(text)
+        if phone_match:
+            phone = phone_match.group(0)
+    
+    return {
+        'title': title,
+        'tender_url': tender_url,
+        'organization': _first_text(first['organization']),
+        'location': _first_text(first['location']),
+        'closing_date': _first_text(first['closing_date']),
+        'posted_date': _first_text(first['posted_date']),
+        'value': _first_text(first['value']),
+        'description': _first_text(first['description']),
+        'categories': [category for category in card_data['every']['categories'] if category],
+        'contact_email': email,
+        'contact_phone': phone,
+    }
+
+# Field lookups for Bids&Tenders and Biddingo listing elements: per field, the first
+# selector whose match has text wins
+_BIDSANDTENDERS_QUERIES = {
+    'title': (
+        "h3", "h4", ".title", ".opportunity-title", ".tender-title",
+        "td:nth-child(2)", "td:nth-child(1)"
+    ),
+    'organization': (
+        ".organization", ".org", ".company", ".agency",
+        "td:nth-child(3)", "td:nth-child(2)"
+    ),
+    'tender_id': (
+        ".tender-id", ".opportunity-id", ".bid-id",
+        "td:nth-child(1)", "td:first-child"
+    ),
+    'closing_date': (
+        ".closing-date", ".deadline", ".due-date",
+        "td:nth-child(4)", "td:nth-child(5)"
+    ),
+    'posted_date': (
+        ".posted-date", ".publish-date", ".issue-date",
+        "td:nth-child(3)", "td:nth-child(4)"
+    ),
+    'value': (
+        ".value", ".amount", ".budget", ".estimated-value",
+        "td:nth-child(5)", "td:nth-child(6)"
+    ),
+    'description': (
+        ".description", ".summary", ".details",
+        "td:nth-child(6)", "td:nth-child(7)"
+    ),
+}
+_BIDDINGO_QUERIES = {
+    'title': (
+        "h3", "h4", ".title", ".opportunity-title", ".tender-title",
+        ".item-title", ".listing-title", ".card-title"
+    ),
+    'organization': (
+        ".organization", ".org", ".company", ".agency", ".client",
+        ".buyer", ".purchaser", ".issuer"
+    ),
+    'tender_id': (
+        ".tender-id", ".opportunity-id", ".bid-id", ".item-id",
+        ".listing-id", ".reference", ".ref", ".number"
+    ),
+    'closing_date': (
+        ".closing-date", ".deadline", ".due-date", ".bid-deadline",
+        ".submission-deadline", ".closing-time"
+    ),
+    'posted_date': (
+        ".posted-date", ".publish-date", ".issue-date", ".published-date",
+        ".created-date", ".posted"
+    ),
+    'value': (
+        ".value", ".amount", ".budget", ".estimated-value",
+        ".contract-value", ".tender-value", ".bid-value"
+    ),
+    'description': (
+        ".description", ".summary", ".details", ".content",
+        ".item-description", ".listing-description"
+    ),
+}
+_LISTING_LINK_QUERIES = {'links': "a"}
+
+def _read_listing_fields(element, queries: Dict[str, tuple]) -> Dict:
+    """Text of each field of a listing element and the hrefs of its links, in one round trip"""
+    element_data = read_element(element, queries, {}, links=_LISTING_LINK_QUERIES)
+    fields = {name: _first_text(matches) for name, matches in element_data['first'].items()}
+    fields['links'] = element_data['links']['links']
+    return fields
+
+def _listing_url(hrefs: List[Optional[str]], default: str) -> str:
+    """First link that looks like a tender page, else default"""
+    for href in hrefs:
+        if href and ('opportunity' in href or 'tender' in href or 'bid' in href):
+            return href
+    return default
+
 class ProvincialScrapers:
     """Scrapers for provincial procurement portals"""
     
@@ -84,7 +599,7 @@ class ProvincialScrapers:
             search_btn.click()
             
             # Parse results
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = _make_soup(driver.page_source, _ALBERTA_STRAINER)
             results_table = soup.find('table', id='ContentPlaceHolder1_GridView1')
             
             if results_table:
@@ -136,24 +651,29 @@ class ProvincialScrapers:
             search_btn.click()
             
             # Parse results
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = _make_soup(driver.page_source, _SASKATCHEWAN_STRAINER)
             results = soup.find_all('div', class_='tender-result')
             
             for result in results:  # Process ALL results, not just first 30
+                # find() returns a Tag or None, so each lookup and its text is taken once
                 org_elem = result.find('span', class_='org')
-                organization = org_elem.text.strip() if org_elem and hasattr(org_elem, 'text') and org_elem.text else 'Saskatchewan Government'
+                org_text = org_elem.text if org_elem is not None else ''
+                organization = org_text.strip() if org_text else 'Saskatchewan Government'
                 closing_elem = result.find('span', class_='closing')
-                closing_date = parse_date(closing_elem.text.strip() if closing_elem and hasattr(closing_elem, 'text') and closing_elem.text else '')
+                closing_date = parse_date(closing_elem.text.strip() if closing_elem is not None else '')
+                title_elem = result.find('h3')
+                link = result.find('a')
+                href = link.get('href') if link is not None else None
                 tender = {
                     'tender_id': result.get('data-tender-id', ''),
-                    'title': result.find('h3').text.strip() if result.find('h3') and hasattr(result.find('h3'), 'text') and result.find('h3').text else '',
+                    'title': title_elem.text.strip() if title_elem is not None else '',
                     'organization': organization,
                     'portal': 'SaskTenders',
                     'value': 0,
                     'closing_date': closing_date,
                     'posted_date': datetime.utcnow(),
                     'location': 'Saskatchewan',
-                    'tender_url': 'https://sasktenders.ca' + str(result.find('a').get('href', '')) if result.find('a') and result.find('a').get('href') else '',
+                    'tender_url': 'https://sasktenders.ca' + str(href) if href else '',
                     'description': '',
                     'categories': [],
                     'keywords': []
@@ -175,10 +695,10 @@ class ProvincialScrapers:
             async with session.get("https://www.gov.mb.ca/tenders/") as response:
                 if response.status == 200:
                     html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
+                    soup = _make_soup(html, _MANITOBA_STRAINER)
                     
                     # Find tender listings
-                    tender_links = soup.find_all('a', href=re.compile(r'/tenders/tender_'))
+                    tender_links = soup.find_all('a', href=_MANITOBA_TENDER_LINK_RE)
                     
                     for link in tender_links:  # Process ALL links, not just first 30
                         tender = {
@@ -224,10 +744,11 @@ class ProvincialScrapers:
             )
             
             # Parse results
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = _make_soup(driver.page_source, _ONTARIO_STRAINER)
             tender_items = soup.find_all('div', class_='tender-item')
             
             for item in tender_items:  # Process ALL items, not just first 30
+                description_elem = item.find('p', class_='description')
                 tender = {
                     'tender_id': item.get('data-id', ''),
                     'title': item.find('h3', class_='tender-title').text.strip() if item.find('h3') else '',
@@ -238,7 +759,7 @@ class ProvincialScrapers:
                     'posted_date': parse_date(item.find('span', class_='posted-date').text if item.find('span', class_='posted-date') else ''),
                     'location': 'Ontario',
                     'tender_url': 'https://ontariotenders.ca' + item.find('a')['href'] if item.find('a') else '',
-                    'description': item.find('p', class_='description').text.strip() if item.find('p', class_='description') else '',
+                    'description': description_elem.text.strip() if description_elem is not None else '',
                     'categories': [],
                     'keywords': []
                 }
@@ -267,7 +788,7 @@ class ProvincialScrapers:
             search_btn.click()
             
             # Parse results
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = _make_soup(driver.page_source, _NOVA_SCOTIA_STRAINER)
             results_table = soup.find('table', id='ctl00_ContentPlaceHolder1_gvTenders')
             
             if results_table:
@@ -321,7 +842,7 @@ class MunicipalScrapers:
             )
             
             # Parse results
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = _make_soup(driver.page_source, _TENDER_ROW_STRAINER)
             tender_rows = soup.find_all('tr', class_='tender-row')
             
             for row in tender_rows[:30]:
@@ -369,7 +890,7 @@ class MunicipalScrapers:
                 EC.presence_of_element_located((By.CLASS_NAME, "tender-row"))
             )
             
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = _make_soup(driver.page_source, _TENDER_ROW_STRAINER)
             tender_rows = soup.find_all('tr', class_='tender-row')
             
             for row in tender_rows:  # Process ALL rows, not just first 30
@@ -417,10 +938,11 @@ class MunicipalScrapers:
             search_input.submit()
             
             # Parse results
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = _make_soup(driver.page_source, _CALGARY_STRAINER)
             opportunities = soup.find_all('div', class_='opportunity')
             
             for opp in opportunities[:30]:
+                description_elem = opp.find('p', class_='desc')
                 tender = {
                     'tender_id': opp.get('data-id', ''),
                     'title': opp.find('h3').text.strip() if opp.find('h3') else '',
@@ -431,7 +953,7 @@ class MunicipalScrapers:
                     'posted_date': datetime.utcnow(),
                     'location': 'Calgary',
                     'tender_url': 'https://procurement.calgary.ca' + opp.find('a')['href'] if opp.find('a') else '',
-                    'description': opp.find('p', class_='desc').text.strip() if opp.find('p', class_='desc') else '',
+                    'description': description_elem.text.strip() if description_elem is not None else '',
                     'categories': [],
                     'keywords': []
                 }
@@ -451,7 +973,7 @@ class MunicipalScrapers:
             async with session.get("https://winnipeg.ca/matmgt/bidopp.asp") as response:
                 if response.status == 200:
                     html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
+                    soup = _make_soup(html, _WINNIPEG_STRAINER)
                     bid_table = soup.find('table', class_='bidopptable')
                     if bid_table:
                         rows = bid_table.find_all('tr')[1:]
@@ -490,7 +1012,7 @@ class MunicipalScrapers:
             search_box.send_keys("training professional development")
             search_btn = driver.find_element(By.ID, "BUYER_SEARCH_WRK_SEARCH_PB")
             search_btn.click()
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = _make_soup(driver.page_source, _VANCOUVER_STRAINER)
             opp_grid = soup.find('table', id='BUYER_SOURCING_SEARCH')
             if opp_grid:
                 rows = opp_grid.find_all('tr')[1:]
@@ -536,7 +1058,7 @@ class MunicipalScrapers:
             search_btn.click()
             
             # Parse results
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = _make_soup(driver.page_source, _TENDER_ROW_STRAINER)
             results = soup.find_all('tr', class_='tender-row')
             
             for row in results:  # Process ALL results, not just first 30
@@ -584,10 +1106,11 @@ class MunicipalScrapers:
             search_input.submit()
             
             # Parse results
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = _make_soup(driver.page_source, _REGINA_STRAINER)
             opportunities = soup.find_all('div', class_='opportunity-item')
             
             for opp in opportunities:  # Process ALL opportunities, not just first 30
+                description_elem = opp.find('p', class_='description')
                 tender = {
                     'tender_id': opp.get('data-ref', ''),
                     'title': opp.find('h3').text.strip() if opp.find('h3') else '',
@@ -598,7 +1121,7 @@ class MunicipalScrapers:
                     'posted_date': parse_date(opp.find('span', class_='posted-date').text if opp.find('span', class_='posted-date') else ''),
                     'location': 'Regina',
                     'tender_url': 'https://procurement.regina.ca' + opp.find('a')['href'] if opp.find('a') else '',
-                    'description': opp.find('p', class_='description').text.strip() if opp.find('p', class_='description') else '',
+                    'description': description_elem.text.strip() if description_elem is not None else '',
                     'categories': [],
                     'keywords': []
                 }
@@ -642,10 +1165,11 @@ class SpecializedScrapers:
             search_btn.click()
             
             # Parse results
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = _make_soup(driver.page_source, _NBON_STRAINER)
             opportunities = soup.find_all('div', class_='opportunity-listing')
             
             for opp in opportunities:  # Process ALL opportunities, not just first 30
+                description_elem = opp.find('p', class_='description')
                 tender = {
                     'tender_id': opp.get('data-opp-id', ''),
                     'title': opp.find('h3', class_='opp-title').text.strip() if opp.find('h3', class_='opp-title') else '',
@@ -656,7 +1180,7 @@ class SpecializedScrapers:
                     'posted_date': parse_date(opp.find('span', class_='posted-date').text if opp.find('span', class_='posted-date') else ''),
                     'location': 'New Brunswick',
                     'tender_url': 'https://nbon.gnb.ca' + opp.find('a')['href'] if opp.find('a') else '',
-                    'description': opp.find('p', class_='description').text.strip() if opp.find('p', class_='description') else '',
+                    'description': description_elem.text.strip() if description_elem is not None else '',
                     'categories': [],
                     'keywords': []
                 }
@@ -678,7 +1202,7 @@ class SpecializedScrapers:
             async with session.get("https://www.princeedwardisland.ca/en/search/site?f%5B0%5D=type%3Atender") as response:
                 if response.status == 200:
                     html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
+                    soup = _make_soup(html, _PEI_STRAINER)
                     
                     # Find search results
                     results = soup.find_all('li', class_='search-result')
@@ -688,9 +1212,15 @@ class SpecializedScrapers:
                         if title_elem:
                             # Check if training related
                             title = title_elem.text.strip()
-                            if any(keyword in title.lower() for keyword in ['training', 'education', 'development', 'professional']):
+                            if _PEI_TRAINING_RE.search(title.lower()):
+                                link = title_elem.find('a')
+                                tender_url = 'https://www.princeedwardisland.ca' + link['href'] if link else ''
+                                tender_id = result.get('data-id')
+                                if tender_id is None:
+                                    # Stable across scans, so a re-listed tender updates instead of duplicating
+                                    tender_id = f"PEI_{hashlib.md5((title + tender_url).encode()).hexdigest()[:8]}"
                                 tender = {
-                                    'tender_id': result.get('data-id', f"PEI_{datetime.now().timestamp()}"),
+                                    'tender_id': tender_id,
                                     'title': title,
                                     'organization': 'PEI Government',
                                     'portal': 'PEI Tenders',
@@ -698,7 +1228,7 @@ class SpecializedScrapers:
                                     'closing_date': None,
                                     'posted_date': datetime.utcnow(),
                                     'location': 'Prince Edward Island',
-                                    'tender_url': 'https://www.princeedwardisland.ca' + title_elem.find('a')['href'] if title_elem.find('a') else '',
+                                    'tender_url': tender_url,
                                     'description': result.find('p', class_='search-snippet').text.strip() if result.find('p', class_='search-snippet') else '',
                                     'categories': [],
                                     'keywords': []
@@ -706,7 +1236,7 @@ class SpecializedScrapers:
                                 
                                 # Try to extract date from description
                                 desc = tender['description']
-                                date_match = re.search(r'Closing[:\s]+([A-Za-z]+ \d+, \d{4})', desc)
+                                date_match = _CLOSING_DATE_RE.search(desc)
                                 if date_match:
                                     tender['closing_date'] = parse_date(date_match.group(1))
                                 
@@ -729,7 +1259,7 @@ class SpecializedScrapers:
             async with session.get(search_url) as response:
                 if response.status == 200:
                     html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
+                    soup = _make_soup(html, _NL_STRAINER)
                     
                     # Find tender listings
                     tender_list = soup.find('div', class_='tender-list')
@@ -737,6 +1267,7 @@ class SpecializedScrapers:
                         tender_items = tender_list.find_all('div', class_='tender-item')
                         
                         for item in tender_items:  # Process ALL items, not just first 30
+                            description_elem = item.find('p', class_='desc')
                             tender = {
                                 'tender_id': item.get('data-tender-id', ''),
                                 'title': item.find('h3').text.strip() if item.find('h3') else '',
@@ -747,7 +1278,7 @@ class SpecializedScrapers:
                                 'posted_date': parse_date(item.find('span', class_='posted').text if item.find('span', class_='posted') else ''),
                                 'location': 'Newfoundland and Labrador',
                                 'tender_url': 'https://www.gov.nl.ca' + item.find('a')['href'] if item.find('a') else '',
-                                'description': item.find('p', class_='desc').text.strip() if item.find('p', class_='desc') else '',
+                                'description': description_elem.text.strip() if description_elem is not None else '',
                                 'categories': [],
                                 'keywords': []
                             }
@@ -778,7 +1309,7 @@ class HealthEducationScrapers:
             search_input.submit()
             
             # Parse results
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = _make_soup(driver.page_source, _BUYBC_STRAINER)
             tender_cards = soup.find_all('div', class_='tender-card')
             
             for card in tender_cards:  # Process ALL cards, not just first 30
@@ -826,7 +1357,7 @@ class HealthEducationScrapers:
             search_btn.click()
             
             # Parse results (similar to MERX scraper)
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = _make_soup(driver.page_source, _ONTARIO_HEALTH_STRAINER)
             opportunities = soup.find_all('div', class_='row')
             
             for opp in opportunities:  # Process ALL opportunities, not just first 20
@@ -921,7 +1452,6 @@ class MERXScraper:
             
             # Navigate to MERX search page
             self.driver.get(target_url)
-            await asyncio.sleep(3)
             
             # Debug: Log the current page title and URL
             logger.info(f"Current page: {self.driver.title}")
@@ -947,7 +1477,6 @@ class MERXScraper:
                 logger.warning("Redirected to login page or error page - trying alternative URL")
                 alternative_url = "https://www.merx.com/public/solicitations/open?"
                 self.driver.get(alternative_url)
-                await asyncio.sleep(3)
                 logger.info(f"Alternative page: {self.driver.title}")
                 logger.info(f"Alternative URL: {self.driver.current_url}")
             
@@ -971,6 +1500,8 @@ class MERXScraper:
                 "input[placeholder*='opportunity']"
             ]
             
+            # Give a script-rendered search box up to 3 seconds to appear
+            wait_for_any(self.driver, search_selectors, timeout=3)
             for selector in search_selectors:
                 try:
                     search_input = self.driver.find_element(By.CSS_SELECTOR, selector)
@@ -1001,7 +1532,6 @@ class MERXScraper:
             try:
                 search_input.clear()
                 search_input.send_keys(query_str)
-                await asyncio.sleep(1)
                 
                 # Try multiple submit button selectors
                 search_button = None
@@ -1027,6 +1557,7 @@ class MERXScraper:
                     except:
                         continue
                 
+                page = self.driver.find_element(By.TAG_NAME, "html")
                 if not search_button:
                     # Try pressing Enter on the search input
                     from selenium.webdriver.common.keys import Keys
@@ -1036,7 +1567,7 @@ class MERXScraper:
                     search_button.click()
                     logger.info("Submitted search using search button")
                 
-                await asyncio.sleep(3)
+                wait_for_page_change(self.driver, page)
                 
             except Exception as e:
                 logger.warning(f"Could not interact with search input: {e}")
@@ -1047,9 +1578,6 @@ class MERXScraper:
             for page in range(1, max_pages + 1):
                 logger.info(f"Processing MERX page {page} for query: {query_str}")
                 
-                # Wait for results to load
-                await asyncio.sleep(3)
-                
                 # Extract tenders from current page
                 page_tenders = await self._extract_tenders_from_page()
                 all_tenders.extend(page_tenders)
@@ -1082,8 +1610,9 @@ class MERXScraper:
                                 continue
                         
                         if next_button and 'disabled' not in next_button.get_attribute('class'):
+                            previous_page = self.driver.find_element(By.TAG_NAME, "html")
                             next_button.click()
-                            await asyncio.sleep(2)
+                            wait_for_page_change(self.driver, previous_page, timeout=2)
                         else:
                             logger.info("Reached last page or no next button found")
                             break
@@ -1105,9 +1634,6 @@ class MERXScraper:
             for page in range(1, max_pages + 1):
                 logger.info(f"Processing MERX page {page} for all open solicitations")
                 
-                # Wait for results to load
-                await asyncio.sleep(3)
-                
                 # Extract tenders from current page
                 page_tenders = await self._extract_tenders_from_page()
                 
@@ -1152,8 +1678,9 @@ class MERXScraper:
                                 continue
                         
                         if next_button and 'disabled' not in next_button.get_attribute('class'):
+                            previous_page = self.driver.find_element(By.TAG_NAME, "html")
                             next_button.click()
-                            await asyncio.sleep(2)
+                            wait_for_page_change(self.driver, previous_page, timeout=2)
                         else:
                             logger.info("Reached last page or no next button found")
                             break
@@ -1168,23 +1695,7 @@ class MERXScraper:
     
     def _calculate_relevance(self, tender, query):
         """Calculate relevance score for a tender based on query"""
-        query_terms = query.lower().split()
-        title = tender.get('title', '').lower()
-        description = tender.get('description', '').lower()
-        
-        score = 0
-        for term in query_terms:
-            if term in title:
-                score += 0.5
-            if term in description:
-                score += 0.3
-            # Check for partial matches
-            if any(term in word for word in title.split()):
-                score += 0.2
-            if any(term in word for word in description.split()):
-                score += 0.1
-        
-        return min(score, 1.0)  # Cap at 1.0
+        return _card_relevance(tender, query)
     
     async def _setup_driver(self):
         """Setup Selenium WebDriver with enhanced configuration"""
@@ -1210,7 +1721,6 @@ class MERXScraper:
         try:
             # Navigate to MERX first to trigger cookie consent
             self.driver.get(self.base_url)
-            await asyncio.sleep(2)
             
             # Look for cookie consent buttons
             cookie_selectors = [
@@ -1231,6 +1741,8 @@ class MERXScraper:
                 "button[class*='cookie']"
             ]
             
+            # A consent banner is injected by script after load; give it up to 2 seconds
+            wait_for_any(self.driver, cookie_selectors, timeout=2)
             for selector in cookie_selectors:
                 try:
                     buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
@@ -1238,7 +1750,7 @@ class MERXScraper:
                         if button.is_displayed() and button.is_enabled():
                             logger.info(f"Found and clicking cookie consent button: {selector}")
                             button.click()
-                            await asyncio.sleep(1)
+                            wait_until_gone(self.driver, button, timeout=1)
                             return
                 except:
                     continue
@@ -1255,7 +1767,6 @@ class MERXScraper:
             
             # Navigate to login page
             self.driver.get(self.login_url)
-            await asyncio.sleep(3)
             
             # Handle cookie consent before login
             await self._handle_cookie_consent()
@@ -1319,14 +1830,10 @@ class MERXScraper:
             try:
                 # Clear fields first
                 username_field.clear()
-                await asyncio.sleep(0.5)
                 username_field.send_keys(self.username)
-                await asyncio.sleep(0.5)
                 
                 password_field.clear()
-                await asyncio.sleep(0.5)
                 password_field.send_keys(self.password)
-                await asyncio.sleep(0.5)
                 
                 logger.info("Credentials entered successfully")
             except Exception as e:
@@ -1346,6 +1853,7 @@ class MERXScraper:
                 "[data-testid*='signin']"
             ]
             
+            login_page = self.driver.find_element(By.TAG_NAME, "html")
             login_button = None
             for selector in login_selectors:
                 try:
@@ -1362,7 +1870,6 @@ class MERXScraper:
                 try:
                     from selenium.webdriver.common.keys import Keys
                     password_field.send_keys(Keys.RETURN)
-                    await asyncio.sleep(3)
                     logger.info("Submitted login with Enter key")
                 except Exception as e:
                     logger.warning(f"Enter key submission failed: {e} - skipping login")
@@ -1371,20 +1878,18 @@ class MERXScraper:
                 # Click login button with better error handling
                 try:
                     login_button.click()
-                    await asyncio.sleep(3)
                     logger.info("Clicked login button")
                 except Exception as e:
                     logger.warning(f"Login button click failed: {e} - trying JavaScript click")
                     try:
                         self.driver.execute_script("arguments[0].click();", login_button)
-                        await asyncio.sleep(3)
                         logger.info("Login button clicked via JavaScript")
                     except Exception as e2:
                         logger.warning(f"JavaScript click also failed: {e2} - skipping login")
                         return
             
-            # Check if login was successful
-            await asyncio.sleep(2)
+            # Check if login was successful once the post-login page has loaded
+            wait_for_page_change(self.driver, login_page, timeout=5)
             if "login" not in self.driver.title.lower() and "sign in" not in self.driver.title.lower():
                 self.is_logged_in = True
                 logger.info("Successfully logged in to MERX")
@@ -1410,21 +1915,11 @@ class MERXScraper:
                 "[class*='solicitation']"
             ]
             
-            results_found = False
-            for selector in result_selectors:
-                try:
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    logger.info(f"Found results container with selector: {selector}")
-                    results_found = True
-                    break
-                except:
-                    continue
-            
-            if not results_found:
-                # Wait for any content to load
-                await asyncio.sleep(5)
+            # One wait for whichever container renders first, not up to 10 seconds per selector
+            selector = wait_for_any(self.driver, result_selectors, timeout=10)
+            if selector:
+                logger.info(f"Found results container with selector: {selector}")
+            else:
                 logger.info("No specific results container found, proceeding with general search")
             
             # Find all tender rows - MERX uses table rows for tenders
@@ -1479,113 +1974,32 @@ class MERXScraper:
     async def _parse_tender_card(self, card):
         """Enhanced tender card parsing with better field extraction"""
         try:
-            # Extract title and link with multiple selectors
-            title_selectors = [
-                "h3 a", ".tender-title a", "h2 a", "h1 a",
-                ".title a", ".name a", ".heading a",
-                "a[href*='tender']", "a[href*='opportunity']", "a[href*='bid']",
-                "a", ".title", ".name", ".heading"
-            ]
-            
-            title_element = None
-            title = ""
-            tender_url = ""
-            
-            for selector in title_selectors:
-                try:
-                    title_element = card.find_element(By.CSS_SELECTOR, selector)
-                    if title_element.is_displayed():
-                        title = title_element.text.strip()
-                        tender_url = title_element.get_attribute('href') or ""
-                        if title and tender_url:
-                            logger.info(f"Found title with selector: {selector}")
-                            break
-                except:
-                    continue
-            
-            if not title:
-                # Fallback: get any text that might be a title
-                title = card.text[:200].strip()  # First 200 chars as title
-                tender_url = card.get_attribute('href') or ""
+            # Every field is read in one browser round trip instead of a find_element per selector
+            fields = _read_card_fields(card)
+            title = fields['title']
+            tender_url = fields['tender_url']
+            description = fields['description']
             
             # Extract tender ID from URL or text
             tender_id = self._extract_tender_id(tender_url, title)
             
-            # Extract organization with multiple selectors
-            org_selectors = [
-                ".organization", ".buyer-name", ".buyer", ".department",
-                ".agency", ".client", ".company", ".org",
-                "[class*='organization']", "[class*='buyer']", "[class*='department']"
-            ]
-            
-            organization = ""
-            for selector in org_selectors:
-                try:
-                    org_element = card.find_element(By.CSS_SELECTOR, selector)
-                    organization = org_element.text.strip()
-                    if organization:
-                        break
-                except:
-                    continue
-            
-            # Extract location with multiple selectors
-            location_selectors = [
-                ".location", ".province", ".region", ".area",
-                ".city", ".state", ".territory",
-                "[class*='location']", "[class*='province']", "[class*='region']"
-            ]
-            
-            location = ""
-            for selector in location_selectors:
-                try:
-                    location_element = card.find_element(By.CSS_SELECTOR, selector)
-                    location = location_element.text.strip()
-                    if location:
-                        break
-                except:
-                    continue
-            
-            # Extract closing date
-            closing_date = await self._extract_date(card, ".closing-date, .deadline, .due-date, [class*='closing'], [class*='deadline']")
-            
-            # Extract posted date
-            posted_date = await self._extract_date(card, ".posted-date, .published-date, .issue-date, [class*='posted'], [class*='published']")
-            
-            # Extract value (if available)
-            value = await self._extract_value(card)
-            
-            # Extract description
-            description = await self._extract_description(card)
-            
-            # Determine priority based on content analysis
-            priority = self._determine_priority(title, description)
-            
-            # Extract matching courses
-            matching_courses = self._extract_matching_courses(title, description)
-            
-            # Extract categories
-            categories = await self._extract_categories(card)
-            
-            # Extract keywords
-            keywords = self._extract_keywords(title, description)
-            
-            # Extract contact info
-            contact_email, contact_phone = await self._extract_contact_info(card)
+            # Priority, matching courses and keywords from one lowercased copy of the text
+            priority, matching_courses, keywords = self._analyze_content(title, description)
             
             return {
                 'tender_id': tender_id,
                 'title': title,
-                'organization': organization,
+                'organization': fields['organization'],
                 'portal': 'CanadaBuys',
-                'value': value,
-                'closing_date': closing_date,
-                'posted_date': posted_date,
+                'value': self._parse_value(fields['value']),
+                'closing_date': self._parse_date(fields['closing_date']),
+                'posted_date': self._parse_date(fields['posted_date']),
                 'description': description,
-                'location': location,
-                'categories': categories,
+                'location': fields['location'],
+                'categories': fields['categories'],
                 'keywords': keywords,
-                'contact_email': contact_email,
-                'contact_phone': contact_phone,
+                'contact_email': fields['contact_email'],
+                'contact_phone': fields['contact_phone'],
                 'tender_url': tender_url,
                 'documents_url': None,
                 'priority': priority,
@@ -1600,14 +2014,12 @@ class MERXScraper:
         """Extract tender ID from URL or title"""
         if url:
             # Try to extract from URL
-            import re
-            match = re.search(r'/(\d+)(?:/|$)', url)
+            match = _URL_NUMERIC_ID_RE.search(url)
             if match:
                 return match.group(1)
         
         # Try to extract from title
-        import re
-        match = re.search(r'#(\d+)', title)
+        match = _TITLE_NUMBER_RE.search(title)
         if match:
             return match.group(1)
         
@@ -1615,204 +2027,22 @@ class MERXScraper:
         import hashlib
         return hashlib.md5(title.encode()).hexdigest()[:8]
     
-    async def _extract_date(self, card, selector):
-        """Extract date from card element"""
-        try:
-            date_element = card.find_element(By.CSS_SELECTOR, selector)
-            date_text = date_element.text
-            return self._parse_date(date_text)
-        except:
-            return None
-    
     def _parse_date(self, date_text):
         """Parse various date formats"""
         if not date_text:
             return None
-        
-        try:
-            # Common date formats
-            from datetime import datetime
-            formats = [
-                '%B %d, %Y',
-                '%b %d, %Y',
-                '%Y-%m-%d',
-                '%m/%d/%Y',
-                '%d/%m/%Y'
-            ]
-            
-            for fmt in formats:
-                try:
-                    return datetime.strptime(date_text.strip(), fmt).isoformat()
-                except:
-                    continue
-            
-            return None
-        except:
-            return None
-    
-    async def _extract_value(self, card):
-        """Extract tender value"""
-        try:
-            value_element = card.find_element(By.CSS_SELECTOR, ".value, .budget, .amount")
-            value_text = value_element.text
-            return self._parse_value(value_text)
-        except:
-            return 0
+        return _parse_card_date(date_text.strip())
     
     def _parse_value(self, value_text):
         """Parse value from text"""
         if not value_text:
             return 0
-        
-        try:
-            import re
-            # Extract numbers and handle currency
-            numbers = re.findall(r'[\d,]+', value_text.replace(',', ''))
-            if numbers:
-                value = float(numbers[0])
-                
-                # Handle multipliers (K, M, B)
-                if 'K' in value_text.upper():
-                    value *= 1000
-                elif 'M' in value_text.upper():
-                    value *= 1000000
-                elif 'B' in value_text.upper():
-                    value *= 1000000000
-                
-                return int(value)
-        except:
-            pass
-        
-        return 0
-    
-    async def _extract_description(self, card):
-        """Extract tender description"""
-        try:
-            desc_element = card.find_element(By.CSS_SELECTOR, ".description, .summary, .details")
-            return desc_element.text
-        except:
-            return ""
+        return _parse_card_value(value_text)
     
-    def _determine_priority(self, title, description):
-        """Determine tender priority based on content analysis"""
+    def _analyze_content(self, title, description):
+        """Return (priority, matching courses, keywords) for a tender's title and description"""
         text = f"{title} {description}".lower()
-        
-        # High priority indicators
-        high_priority_terms = [
-            'training', 'professional development', 'certification',
-            'AWS', 'Azure', 'cybersecurity', 'project management',
-            'agile', 'scrum', 'leadership', 'coaching'
-        ]
-        
-        # Medium priority indicators
-        medium_priority_terms = [
-            'consulting', 'implementation', 'change management',
-            'development', 'education', 'learning'
-        ]
-        
-        high_count = sum(1 for term in high_priority_terms if term in text)
-        medium_count = sum(1 for term in medium_priority_terms if term in text)
-        
-        if high_count >= 2:
-            return 'high'
-        elif high_count >= 1 or medium_count >= 2:
-            return 'medium'
-        else:
-            return 'low'
-    
-    def _extract_matching_courses(self, title, description):
-        """Extract matching TKA courses from content"""
-        text = f"{title} {description}".lower()
-        matching_courses = []
-        
-        # Course mappings
-        course_mappings = {
-            'aws': 'AWS Training',
-            'azure': 'Azure Training',
-            'cloud': 'Cloud Computing',
-            'cybersecurity': 'Cybersecurity Training',
-            'cissp': 'CISSP Certification',
-            'project management': 'Project Management',
-            'pmp': 'PMP Certification',
-            'prince2': 'PRINCE2 Certification',
-            'agile': 'Agile Training',
-            'scrum': 'Scrum Training',
-            'leadership': 'Leadership Development',
-            'itil': 'ITIL Training',
-            'devops': 'DevOps Training',
-            'data analytics': 'Data Analytics',
-            'business intelligence': 'Business Intelligence',
-            'change management': 'Change Management',
-            'coaching': 'Executive Coaching'
-        }
-        
-        for keyword, course in course_mappings.items():
-            if keyword in text:
-                matching_courses.append(course)
-        
-        return matching_courses
-    
-    async def _extract_categories(self, card):
-        """Extract tender categories"""
-        try:
-            category_elements = card.find_elements(By.CSS_SELECTOR, ".category, .tag, .classification")
-            categories = []
-            for element in category_elements:
-                category = element.text
-                if category:
-                    categories.append(category.strip())
-            return categories
-        except:
-            return []
-    
-    def _extract_keywords(self, title, description):
-        """Extract keywords from title and description"""
-        text = f"{title} {description}".lower()
-        keywords = []
-        
-        # Extract meaningful keywords
-        import re
-        words = re.findall(r'\b\w{4,}\b', text)
-        
-        # Filter for relevant keywords
-        relevant_words = [
-            'training', 'development', 'consulting', 'implementation',
-            'management', 'leadership', 'technology', 'digital',
-            'transformation', 'change', 'process', 'system'
-        ]
-        
-        for word in words:
-            if word in relevant_words and word not in keywords:
-                keywords.append(word)
-        
-        return keywords[:10]  # Limit to 10 keywords
-    
-    async def _extract_contact_info(self, card):
-        """Extract contact information"""
-        try:
-            # Look for contact elements
-            contact_elements = card.find_elements(By.CSS_SELECTOR, ".contact, .contact-info, .buyer-contact")
-            
-            email = None
-            phone = None
-            
-            for element in contact_elements:
-                text = element.text
-                
-                # Extract email
-                import re
-                email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
-                if email_match:
-                    email = email_match.group(0)
-                
-                # Extract phone
-                phone_match = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
-                if phone_match:
-                    phone = phone_match.group(0)
-            
-            return email, phone
-        except:
-            return None, None
+        return _card_priority(text), _card_courses(text), _card_keywords(text)
 
 class CanadaBuysScraper:
     """Enhanced CanadaBuys scraper with multiple search strategies"""
@@ -1845,7 +2075,6 @@ class CanadaBuysScraper:
             # Navigate to search page with query parameters
             search_url_with_query = f"{self.search_url}{query_str}"
             self.driver.get(search_url_with_query)
-            await asyncio.sleep(3)
             
             # Debug: Log the current page title and URL
             logger.info(f"Current page: {self.driver.title}")
@@ -1868,7 +2097,7 @@ class CanadaBuysScraper:
                         accept_button = self.driver.find_element(By.CSS_SELECTOR, selector)
                         if accept_button.is_displayed():
                             accept_button.click()
-                            await asyncio.sleep(1)
+                            wait_until_gone(self.driver, accept_button, timeout=1)
                             break
                     except:
                         continue
@@ -1896,6 +2125,8 @@ class CanadaBuysScraper:
                 "input[name='words']"
             ]
             
+            # Give a script-rendered search box up to 3 seconds to appear
+            wait_for_any(self.driver, search_selectors, timeout=3)
             for selector in search_selectors:
                 try:
                     search_input = self.driver.find_element(By.CSS_SELECTOR, selector)
@@ -1936,7 +2167,6 @@ class CanadaBuysScraper:
             try:
                 search_input.clear()
                 search_input.send_keys(query_str)
-                await asyncio.sleep(1)
                 
                 # Try multiple submit button selectors
                 search_button = None
@@ -1962,6 +2192,7 @@ class CanadaBuysScraper:
                     except:
                         continue
                 
+                page = self.driver.find_element(By.TAG_NAME, "html")
                 if not search_button:
                     # Try pressing Enter on the search input
                     from selenium.webdriver.common.keys import Keys
@@ -1971,7 +2202,7 @@ class CanadaBuysScraper:
                     search_button.click()
                     logger.info("Submitted search using search button")
                 
-                await asyncio.sleep(3)
+                wait_for_page_change(self.driver, page)
                 
             except Exception as e:
                 logger.warning(f"Could not interact with search input: {e}")
@@ -2001,6 +2232,7 @@ class CanadaBuysScraper:
                     except:
                         continue
                 if per_page_control:
+                    page = self.driver.find_element(By.TAG_NAME, "html")
                     tag = per_page_control.tag_name.lower()
                     if tag == 'select':
                         from selenium.webdriver.support.ui import Select
@@ -2009,7 +2241,6 @@ class CanadaBuysScraper:
                         logger.info("Set results per page to 200 via select dropdown")
                     elif tag == 'button':
                         per_page_control.click()
-                        await asyncio.sleep(1)
                         # Try to find the 200 option in the dropdown
                         option_selectors = [
                             "li[data-value='200']",
@@ -2019,6 +2250,7 @@ class CanadaBuysScraper:
                             "option[value='200']",
                             "[role='option'][data-value='200']"
                         ]
+                        wait_for_any(self.driver, option_selectors, timeout=1)
                         for opt_selector in option_selectors:
                             try:
                                 option = self.driver.find_element(By.CSS_SELECTOR, opt_selector)
@@ -2028,7 +2260,8 @@ class CanadaBuysScraper:
                                     break
                             except:
                                 continue
-                    await asyncio.sleep(2)
+                    # Changing the page size reloads the results
+                    wait_for_page_change(self.driver, page, timeout=2)
                 else:
                     logger.warning("Could not find results-per-page control to set 200 per page")
             except Exception as e:
@@ -2038,9 +2271,6 @@ class CanadaBuysScraper:
             for page in range(1, max_pages + 1):
                 logger.info(f"Processing CanadaBuys page {page} for query: {query}")
                 
-                # Wait for results to load
-                await asyncio.sleep(3)
-                
                 # Extract tenders from current page
                 page_tenders = await self._extract_tenders_from_page()
                 all_tenders.extend(page_tenders)
@@ -2073,8 +2303,9 @@ class CanadaBuysScraper:
                                 continue
                         
                         if next_button and 'disabled' not in next_button.get_attribute('class'):
+                            previous_page = self.driver.find_element(By.TAG_NAME, "html")
                             next_button.click()
-                            await asyncio.sleep(2)
+                            wait_for_page_change(self.driver, previous_page, timeout=2)
                         else:
                             logger.info("Reached last page or no next button found")
                             break
@@ -2097,9 +2328,6 @@ class CanadaBuysScraper:
             for page in range(1, max_pages + 1):
                 logger.info(f"Processing CanadaBuys page {page} for all opportunities")
                 
-                # Wait for results to load
-                await asyncio.sleep(3)
-                
                 # Extract tenders from current page
                 page_tenders = await self._extract_tenders_from_page()
                 
@@ -2143,8 +2371,9 @@ class CanadaBuysScraper:
                                 continue
                         
                         if next_button and 'disabled' not in next_button.get_attribute('class'):
+                            previous_page = self.driver.find_element(By.TAG_NAME, "html")
                             next_button.click()
-                            await asyncio.sleep(2)
+                            wait_for_page_change(self.driver, previous_page, timeout=2)
                         else:
                             logger.info("Reached last page or no next button found")
                             break
@@ -2159,23 +2388,7 @@ class CanadaBuysScraper:
     
     def _calculate_relevance(self, tender, query):
         """Calculate relevance score for a tender based on query"""
-        query_terms = query.lower().split()
-        title = tender.get('title', '').lower()
-        description = tender.get('description', '').lower()
-        
-        score = 0
-        for term in query_terms:
-            if term in title:
-                score += 0.5
-            if term in description:
-                score += 0.3
-            # Check for partial matches
-            if any(term in word for word in title.split()):
-                score += 0.2
-            if any(term in word for word in description.split()):
-                score += 0.1
-        
-        return min(score, 1.0)  # Cap at 1.0
+        return _card_relevance(tender, query)
     
     async def _setup_driver(self):
         """Setup Selenium WebDriver with enhanced configuration"""
@@ -2217,21 +2430,11 @@ class CanadaBuysScraper:
                 "div[class*='item']"        # Any item div
             ]
             
-            results_found = False
-            for selector in result_selectors:
-                try:
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    logger.info(f"Found results container with selector: {selector}")
-                    results_found = True
-                    break
-                except:
-                    continue
-            
-            if not results_found:
-                # Wait for any content to load
-                await asyncio.sleep(5)
+            # One wait for whichever container renders first, not up to 10 seconds per selector
+            selector = wait_for_any(self.driver, result_selectors, timeout=10)
+            if selector:
+                logger.info(f"Found results container with selector: {selector}")
+            else:
                 logger.info("No specific results container found, proceeding with general search")
             
             # Find all tender cards - CanadaBuys uses various formats
@@ -2286,113 +2489,32 @@ class CanadaBuysScraper:
     async def _parse_tender_card(self, card):
         """Enhanced tender card parsing with better field extraction"""
         try:
-            # Extract title and link with multiple selectors
-            title_selectors = [
-                "h3 a", ".tender-title a", "h2 a", "h1 a",
-                ".title a", ".name a", ".heading a",
-                "a[href*='tender']", "a[href*='opportunity']", "a[href*='bid']",
-                "a", ".title", ".name", ".heading"
-            ]
-            
-            title_element = None
-            title = ""
-            tender_url = ""
-            
-            for selector in title_selectors:
-                try:
-                    title_element = card.find_element(By.CSS_SELECTOR, selector)
-                    if title_element.is_displayed():
-                        title = title_element.text.strip()
-                        tender_url = title_element.get_attribute('href') or ""
-                        if title and tender_url:
-                            logger.info(f"Found title with selector: {selector}")
-                            break
-                except:
-                    continue
-            
-            if not title:
-                # Fallback: get any text that might be a title
-                title = card.text[:200].strip()  # First 200 chars as title
-                tender_url = card.get_attribute('href') or ""
+            # Every field is read in one browser round trip instead of a find_element per selector
+            fields = _read_card_fields(card)
+            title = fields['title']
+            tender_url = fields['tender_url']
+            description = fields['description']
             
             # Extract tender ID from URL or text
             tender_id = self._extract_tender_id(tender_url, title)
             
-            # Extract organization with multiple selectors
-            org_selectors = [
-                ".organization", ".buyer-name", ".buyer", ".department",
-                ".agency", ".client", ".company", ".org",
-                "[class*='organization']", "[class*='buyer']", "[class*='department']"
-            ]
-            
-            organization = ""
-            for selector in org_selectors:
-                try:
-                    org_element = card.find_element(By.CSS_SELECTOR, selector)
-                    organization = org_element.text.strip()
-                    if organization:
-                        break
-                except:
-                    continue
-            
-            # Extract location with multiple selectors
-            location_selectors = [
-                ".location", ".province", ".region", ".area",
-                ".city", ".state", ".territory",
-                "[class*='location']", "[class*='province']", "[class*='region']"
-            ]
-            
-            location = ""
-            for selector in location_selectors:
-                try:
-                    location_element = card.find_element(By.CSS_SELECTOR, selector)
-                    location = location_element.text.strip()
-                    if location:
-                        break
-                except:
-                    continue
-            
-            # Extract closing date
-            closing_date = await self._extract_date(card, ".closing-date, .deadline, .due-date, [class*='closing'], [class*='deadline']")
-            
-            # Extract posted date
-            posted_date = await self._extract_date(card, ".posted-date, .published-date, .issue-date, [class*='posted'], [class*='published']")
-            
-            # Extract value (if available)
-            value = await self._extract_value(card)
-            
-            # Extract description
-            description = await self._extract_description(card)
-            
-            # Determine priority based on content analysis
-            priority = self._determine_priority(title, description)
-            
-            # Extract matching courses
-            matching_courses = self._extract_matching_courses(title, description)
-            
-            # Extract categories
-            categories = await self._extract_categories(card)
-            
-            # Extract keywords
-            keywords = self._extract_keywords(title, description)
-            
-            # Extract contact info
-            contact_email, contact_phone = await self._extract_contact_info(card)
+            # Priority, matching courses and keywords from one lowercased copy of the text
+            priority, matching_courses, keywords = self._analyze_content(title, description)
             
             return {
                 'tender_id': tender_id,
                 'title': title,
-                'organization': organization,
+                'organization': fields['organization'],
                 'portal': 'CanadaBuys',
-                'value': value,
-                'closing_date': closing_date,
-                'posted_date': posted_date,
+                'value': self._parse_value(fields['value']),
+                'closing_date': self._parse_date(fields['closing_date']),
+                'posted_date': self._parse_date(fields['posted_date']),
                 'description': description,
-                'location': location,
-                'categories': categories,
+                'location': fields['location'],
+                'categories': fields['categories'],
                 'keywords': keywords,
-                'contact_email': contact_email,
-                'contact_phone': contact_phone,
+                'contact_email': fields['contact_email'],
+                'contact_phone': fields['contact_phone'],
                 'tender_url': tender_url,
                 'documents_url': None,
                 'priority': priority,
@@ -2407,14 +2529,12 @@ class CanadaBuysScraper:
         """Extract tender ID from URL or title"""
         if url:
             # Try to extract from URL
-            import re
-            match = re.search(r'/(\d+)(?:/|$)', url)
+            match = _URL_NUMERIC_ID_RE.search(url)
             if match:
                 return match.group(1)
         
         # Try to extract from title
-        import re
-        match = re.search(r'#(\d+)', title)
+        match = _TITLE_NUMBER_RE.search(title)
         if match:
             return match.group(1)
         
@@ -2422,204 +2542,22 @@ class CanadaBuysScraper:
         import hashlib
         return hashlib.md5(title.encode()).hexdigest()[:8]
     
-    async def _extract_date(self, card, selector):
-        """Extract date from card element"""
-        try:
-            date_element = card.find_element(By.CSS_SELECTOR, selector)
-            date_text = date_element.text
-            return self._parse_date(date_text)
-        except:
-            return None
-    
     def _parse_date(self, date_text):
         """Parse various date formats"""
         if not date_text:
             return None
-        
-        try:
-            # Common date formats
-            from datetime import datetime
-            formats = [
-                '%B %d, %Y',
-                '%b %d, %Y',
-                '%Y-%m-%d',
-                '%m/%d/%Y',
-                '%d/%m/%Y'
-            ]
-            
-            for fmt in formats:
-                try:
-                    return datetime.strptime(date_text.strip(), fmt).isoformat()
-                except:
-                    continue
-            
-            return None
-        except:
-            return None
-    
-    async def _extract_value(self, card):
-        """Extract tender value"""
-        try:
-            value_element = card.find_element(By.CSS_SELECTOR, ".value, .budget, .amount")
-            value_text = value_element.text
-            return self._parse_value(value_text)
-        except:
-            return 0
+        return _parse_card_date(date_text.strip())
     
     def _parse_value(self, value_text):
         """Parse value from text"""
         if not value_text:
             return 0
-        
-        try:
-            import re
-            # Extract numbers and handle currency
-            numbers = re.findall(r'[\d,]+', value_text.replace(',', ''))
-            if numbers:
-                value = float(numbers[0])
-                
-                # Handle multipliers (K, M, B)
-                if 'K' in value_text.upper():
-                    value *= 1000
-                elif 'M' in value_text.upper():
-                    value *= 1000000
-                elif 'B' in value_text.upper():
-                    value *= 1000000000
-                
-                return int(value)
-        except:
-            pass
-        
-        return 0
-    
-    async def _extract_description(self, card):
-        """Extract tender description"""
-        try:
-            desc_element = card.find_element(By.CSS_SELECTOR, ".description, .summary, .details")
-            return desc_element.text
-        except:
-            return ""
-    
-    def _determine_priority(self, title, description):
-        """Determine tender priority based on content analysis"""
-        text = f"{title} {description}".lower()
-        
-        # High priority indicators
-        high_priority_terms = [
-            'training', 'professional development', 'certification',
-            'AWS', 'Azure', 'cybersecurity', 'project management',
-            'agile', 'scrum', 'leadership', 'coaching'
-        ]
-        
-        # Medium priority indicators
-        medium_priority_terms = [
-            'consulting', 'implementation', 'change management',
-            'development', 'education', 'learning'
-        ]
-        
-        high_count = sum(1 for term in high_priority_terms if term in text)
-        medium_count = sum(1 for term in medium_priority_terms if term in text)
-        
-        if high_count >= 2:
-            return 'high'
-        elif high_count >= 1 or medium_count >= 2:
-            return 'medium'
-        else:
-            return 'low'
-    
-    def _extract_matching_courses(self, title, description):
-        """Extract matching TKA courses from content"""
-        text = f"{title} {description}".lower()
-        matching_courses = []
-        
-        # Course mappings
-        course_mappings = {
-            'aws': 'AWS Training',
-            'azure': 'Azure Training',
-            'cloud': 'Cloud Computing',
-            'cybersecurity': 'Cybersecurity Training',
-            'cissp': 'CISSP Certification',
-            'project management': 'Project Management',
-            'pmp': 'PMP Certification',
-            'prince2': 'PRINCE2 Certification',
-            'agile': 'Agile Training',
-            'scrum': 'Scrum Training',
-            'leadership': 'Leadership Development',
-            'itil': 'ITIL Training',
-            'devops': 'DevOps Training',
-            'data analytics': 'Data Analytics',
-            'business intelligence': 'Business Intelligence',
-            'change management': 'Change Management',
-            'coaching': 'Executive Coaching'
-        }
-        
-        for keyword, course in course_mappings.items():
-            if keyword in text:
-                matching_courses.append(course)
-        
-        return matching_courses
+        return _parse_card_value(value_text)
     
-    async def _extract_categories(self, card):
-        """Extract tender categories"""
-        try:
-            category_elements = card.find_elements(By.CSS_SELECTOR, ".category, .tag, .classification")
-            categories = []
-            for element in category_elements:
-                category = element.text
-                if category:
-                    categories.append(category.strip())
-            return categories
-        except:
-            return []
-    
-    def _extract_keywords(self, title, description):
-        """Extract keywords from title and description"""
+    def _analyze_content(self, title, description):
+        """Return (priority, matching courses, keywords) for a tender's title and description"""
         text = f"{title} {description}".lower()
-        keywords = []
-        
-        # Extract meaningful keywords
-        import re
-        words = re.findall(r'\b\w{4,}\b', text)
-        
-        # Filter for relevant keywords
-        relevant_words = [
-            'training', 'development', 'consulting', 'implementation',
-            'management', 'leadership', 'technology', 'digital',
-            'transformation', 'change', 'process', 'system'
-        ]
-        
-        for word in words:
-            if word in relevant_words and word not in keywords:
-                keywords.append(word)
-        
-        return keywords[:10]  # Limit to 10 keywords
-    
-    async def _extract_contact_info(self, card):
-        """Extract contact information"""
-        try:
-            # Look for contact elements
-            contact_elements = card.find_elements(By.CSS_SELECTOR, ".contact, .contact-info, .buyer-contact")
-            
-            email = None
-            phone = None
-            
-            for element in contact_elements:
-                text = element.text
-                
-                # Extract email
-                import re
-                email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
-                if email_match:
-                    email = email_match.group(0)
-                
-                # Extract phone
-                phone_match = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
-                if phone_match:
-                    phone = phone_match.group(0)
-            
-            return email, phone
-        except:
-            return None, None
+        return _card_priority(text), _card_courses(text), _card_keywords(text)
 
 class BidsAndTendersScraper:
     """Scraper for Bids&Tenders portal"""
@@ -2697,7 +2635,7 @@ class BidsAndTendersScraper:
                     cookie_btn = driver.find_element(By.CSS_SELECTOR, selector)
                     if cookie_btn and cookie_btn.is_displayed():
                         cookie_btn.click()
-                        await asyncio.sleep(2)
+                        wait_until_gone(driver, cookie_btn, timeout=2)
                         logger.info("Accepted cookies on Bids&Tenders")
                         break
                 except:
@@ -2723,7 +2661,6 @@ class BidsAndTendersScraper:
             # Build search URL
             search_url = f"{self.search_url}?{'&'.join([f'{k}={v}' for k, v in search_params.items()])}"
             driver.get(search_url)
-            await asyncio.sleep(3)
             
             # Process multiple pages
             for page in range(1, max_pages + 1):
@@ -2741,8 +2678,6 @@ class BidsAndTendersScraper:
                             logger.info("No more pages available")
                             break
                     
-                    await asyncio.sleep(2)
-                    
                 except Exception as e:
                     logger.warning(f"Error processing page {page}: {e}")
                     break
@@ -2770,6 +2705,8 @@ class BidsAndTendersScraper:
                 "div[class*='tender']"
             ]
             
+            # Listings may be rendered by script after load; wait up to 3 seconds for any
+            wait_for_any(driver, tender_selectors, timeout=3)
             tender_elements = []
             for selector in tender_selectors:
                 try:
@@ -2799,62 +2736,25 @@ class BidsAndTendersScraper:
     async def _parse_tender_element(self, element):
         """Parse individual tender element"""
         try:
-            # Extract basic information
-            title = self._extract_text(element, [
-                "h3", "h4", ".title", ".opportunity-title", ".tender-title",
-                "td:nth-child(2)", "td:nth-child(1)"
-            ])
-            
+            fields = _read_listing_fields(element, _BIDSANDTENDERS_QUERIES)
+            title = fields['title']
             if not title:
                 return None
             
-            # Extract organization
-            organization = self._extract_text(element, [
-                ".organization", ".org", ".company", ".agency",
-                "td:nth-child(3)", "td:nth-child(2)"
-            ]) or "Unknown Organization"
-            
-            # Extract tender ID
-            tender_id = self._extract_tender_id(element, title)
-            
-            # Extract dates
-            closing_date = await self._extract_date(element, [
-                ".closing-date", ".deadline", ".due-date",
-                "td:nth-child(4)", "td:nth-child(5)"
-            ])
-            
-            posted_date = await self._extract_date(element, [
-                ".posted-date", ".publish-date", ".issue-date",
-                "td:nth-child(3)", "td:nth-child(4)"
-            ]) or datetime.utcnow()
-            
-            # Extract value
-            value = await self._extract_value(element)
-            
-            # Extract URL
-            tender_url = self._extract_url(element)
-            
-            # Extract description
-            description = self._extract_text(element, [
-                ".description", ".summary", ".details",
-                "td:nth-child(6)", "td:nth-child(7)"
-            ]) or ""
-            
+            description = fields['description']
             tender = {
-                'tender_id': tender_id,
+                'tender_id': fields['tender_id'] or hashlib.md5(title.encode()).hexdigest()[:8],
                 'title': title,
-                'organization': organization,
+                'organization': fields['organization'] or "Unknown Organization",
                 'portal': 'Bids&Tenders',
-                'value': value,
-                'closing_date': closing_date,
-                'posted_date': posted_date,
+                'value': parse_value(fields['value']),
+                'closing_date': parse_date(fields['closing_date']),
+                'posted_date': parse_date(fields['posted_date']) or datetime.utcnow(),
                 'location': 'Canada',
-                'tender_url': tender_url,
+                'tender_url': _listing_url(fields['links'], self.base_url),
                 'description': description,
                 'categories': [],
-                'keywords': self._extract_keywords(title, description),
-                'matching_courses': self._extract_matching_courses(title, description),
-                'priority': self._determine_priority(title, description)
+                **self._analyze_content(title, description)
             }
             
             return tender
@@ -2863,170 +2763,14 @@ class BidsAndTendersScraper:
             logger.warning(f"Error parsing tender element: {e}")
             return None
     
-    def _extract_text(self, element, selectors):
-        """Extract text from element using multiple selectors"""
-        for selector in selectors:
-            try:
-                found = element.find_element(By.CSS_SELECTOR, selector)
-                if found and found.text.strip():
-                    return found.text.strip()
-            except:
-                continue
-        return ""
-    
-    def _extract_tender_id(self, element, title):
-        """Extract tender ID from element or generate from title"""
-        # Try to find tender ID in various locations
-        id_selectors = [
-            ".tender-id", ".opportunity-id", ".bid-id",
-            "td:nth-child(1)", "td:first-child"
-        ]
-        
-        for selector in id_selectors:
-            try:
-                found = element.find_element(By.CSS_SELECTOR, selector)
-                if found and found.text.strip():
-                    return found.text.strip()
-            except:
-                continue
-        
-        # Generate ID from title
-        return hashlib.md5(title.encode()).hexdigest()[:8]
-    
-    async def _extract_date(self, element, selectors):
-        """Extract date from element"""
-        for selector in selectors:
-            try:
-                found = element.find_element(By.CSS_SELECTOR, selector)
-                if found and found.text.strip():
-                    return parse_date(found.text.strip())
-            except:
-                continue
-        return None
-    
-    async def _extract_value(self, element):
-        """Extract monetary value from element"""
-        value_selectors = [
-            ".value", ".amount", ".budget", ".estimated-value",
-            "td:nth-child(5)", "td:nth-child(6)"
-        ]
-        
-        for selector in value_selectors:
-            try:
-                found = element.find_element(By.CSS_SELECTOR, selector)
-                if found and found.text.strip():
-                    return parse_value(found.text.strip())
-            except:
-                continue
-        return 0.0
-    
-    def _extract_url(self, element):
-        """Extract tender URL from element"""
-        try:
-            # Look for links
-            links = element.find_elements(By.TAG_NAME, "a")
-            for link in links:
-                href = link.get_attribute('href')
-                if href and ('opportunity' in href or 'tender' in href or 'bid' in href):
-                    return href
-        except:
-            pass
-        
-        return self.base_url
-    
-    def _extract_keywords(self, title, description):
-        """Extract keywords from title and description"""
-        text = f"{title} {description}".lower()
-        keywords = []
-        
-        # Training-related keywords
-        training_keywords = [
-            'training', 'education', 'learning', 'development', 'workshop',
-            'seminar', 'course', 'certification', 'professional development',
-            'skill development', 'capacity building', 'upskilling', 'reskilling'
-        ]
-        
-        for keyword in training_keywords:
-            if keyword in text:
-                keywords.append(keyword)
-        
-        return keywords
-    
-    def _extract_matching_courses(self, title, description):
-        """Extract matching courses from title and description"""
+    def _analyze_content(self, title, description):
+        """Keywords, matching courses and priority for a tender's title and description"""
         text = f"{title} {description}".lower()
-        matching_courses = []
-        
-        # Map keywords to TKA courses
-        course_mapping = {
-            'project management': 'Project Management',
-            'leadership': 'Leadership',
-            'communication': 'Communication',
-            'negotiation': 'Negotiation',
-            'contract management': 'Contract Management',
-            'procurement': 'Procurement',
-            'supply chain': 'Supply Chain',
-            'risk management': 'Risk Management',
-            'strategic planning': 'Strategic Planning',
-            'change management': 'Change Management',
-            'team building': 'Team Building',
-            'conflict resolution': 'Conflict Resolution',
-            'time management': 'Time Management',
-            'problem solving': 'Problem Solving',
-            'decision making': 'Decision Making',
-            'financial management': 'Financial Management',
-            'human resources': 'Human Resources',
-            'marketing': 'Marketing',
-            'sales': 'Sales',
-            'customer service': 'Customer Service',
-            'quality management': 'Quality Management',
-            'process improvement': 'Process Improvement',
-            'innovation': 'Innovation',
-            'digital transformation': 'Digital Transformation',
-            'data analysis': 'Data Analysis',
-            'business intelligence': 'Business Intelligence',
-            'cybersecurity': 'Cybersecurity',
-            'cloud computing': 'Cloud Computing',
-            'agile': 'Agile',
-            'scrum': 'Scrum',
-            'lean six sigma': 'Lean Six Sigma',
-            'iso': 'ISO Standards',
-            'compliance': 'Compliance',
-            'regulatory': 'Regulatory Affairs'
+        return {
+            'keywords': _element_keywords(text),
+            'matching_courses': _element_courses(text),
+            'priority': _element_priority(text)
         }
-        
-        for keyword, course in course_mapping.items():
-            if keyword in text:
-                matching_courses.append(course)
-        
-        return matching_courses
-    
-    def _determine_priority(self, title, description):
-        """Determine priority based on content"""
-        text = f"{title} {description}".lower()
-        
-        # High priority keywords
-        high_priority = [
-            'training', 'education', 'learning', 'development', 'workshop',
-            'seminar', 'course', 'certification', 'professional development',
-            'consulting', 'advisory', 'implementation', 'change management'
-        ]
-        
-        # Medium priority keywords
-        medium_priority = [
-            'service', 'support', 'maintenance', 'management', 'administration',
-            'coordination', 'facilitation', 'delivery', 'provision'
-        ]
-        
-        for keyword in high_priority:
-            if keyword in text:
-                return 'high'
-        
-        for keyword in medium_priority:
-            if keyword in text:
-                return 'medium'
-        
-        return 'low'
     
     async def _go_to_next_page(self, driver):
         """Navigate to next page"""
@@ -3045,8 +2789,9 @@ class BidsAndTendersScraper:
                 try:
                     next_btn = driver.find_element(By.CSS_SELECTOR, selector)
                     if next_btn and next_btn.is_displayed() and next_btn.is_enabled():
+                        previous_page = driver.find_element(By.TAG_NAME, "html")
                         driver.execute_script("arguments[0].click();", next_btn)
-                        await asyncio.sleep(3)
+                        wait_for_page_change(driver, previous_page)
                         logger.info("Navigated to next page")
                         return True
                 except:
@@ -3135,7 +2880,7 @@ class BiddingoScraper:
                     cookie_btn = driver.find_element(By.CSS_SELECTOR, selector)
                     if cookie_btn and cookie_btn.is_displayed():
                         cookie_btn.click()
-                        await asyncio.sleep(2)
+                        wait_until_gone(driver, cookie_btn, timeout=2)
                         logger.info("Accepted cookies on Biddingo")
                         break
                 except:
@@ -3155,7 +2900,6 @@ class BiddingoScraper:
                 search_url = f"{self.base_url}/opportunities"
             
             driver.get(search_url)
-            await asyncio.sleep(3)
             
             # Process multiple pages
             for page in range(1, max_pages + 1):
@@ -3173,8 +2917,6 @@ class BiddingoScraper:
                             logger.info("No more pages available")
                             break
                     
-                    await asyncio.sleep(2)
-                    
                 except Exception as e:
                     logger.warning(f"Error processing page {page}: {e}")
                     break
@@ -3205,6 +2947,8 @@ class BiddingoScraper:
                 ".item"
             ]
             
+            # Listings may be rendered by script after load; wait up to 3 seconds for any
+            wait_for_any(driver, tender_selectors, timeout=3)
             tender_elements = []
             for selector in tender_selectors:
                 try:
@@ -3234,62 +2978,25 @@ class BiddingoScraper:
     async def _parse_tender_element(self, element):
         """Parse individual tender element"""
         try:
-            # Extract basic information
-            title = self._extract_text(element, [
-                "h3", "h4", ".title", ".opportunity-title", ".tender-title",
-                ".item-title", ".listing-title", ".card-title"
-            ])
-            
+            fields = _read_listing_fields(element, _BIDDINGO_QUERIES)
+            title = fields['title']
             if not title:
                 return None
             
-            # Extract organization
-            organization = self._extract_text(element, [
-                ".organization", ".org", ".company", ".agency", ".client",
-                ".buyer", ".purchaser", ".issuer"
-            ]) or "Unknown Organization"
-            
-            # Extract tender ID
-            tender_id = self._extract_tender_id(element, title)
-            
-            # Extract dates
-            closing_date = await self._extract_date(element, [
-                ".closing-date", ".deadline", ".due-date", ".bid-deadline",
-                ".submission-deadline", ".closing-time"
-            ])
-            
-            posted_date = await self._extract_date(element, [
-                ".posted-date", ".publish-date", ".issue-date", ".published-date",
-                ".created-date", ".posted"
-            ]) or datetime.utcnow()
-            
-            # Extract value
-            value = await self._extract_value(element)
-            
-            # Extract URL
-            tender_url = self._extract_url(element)
-            
-            # Extract description
-            description = self._extract_text(element, [
-                ".description", ".summary", ".details", ".content",
-                ".item-description", ".listing-description"
-            ]) or ""
-            
+            description = fields['description']
             tender = {
-                'tender_id': tender_id,
+                'tender_id': fields['tender_id'] or hashlib.md5(title.encode()).hexdigest()[:8],
                 'title': title,
-                'organization': organization,
+                'organization': fields['organization'] or "Unknown Organization",
                 'portal': 'Biddingo',
-                'value': value,
-                'closing_date': closing_date,
-                'posted_date': posted_date,
+                'value': parse_value(fields['value']),
+                'closing_date': parse_date(fields['closing_date']),
+                'posted_date': parse_date(fields['posted_date']) or datetime.utcnow(),
                 'location': 'Canada',
-                'tender_url': tender_url,
+                'tender_url': _listing_url(fields['links'], self.base_url),
                 'description': description,
                 'categories': [],
-                'keywords': self._extract_keywords(title, description),
-                'matching_courses': self._extract_matching_courses(title, description),
-                'priority': self._determine_priority(title, description)
+                **self._analyze_content(title, description)
             }
             
             return tender
@@ -3298,170 +3005,14 @@ class BiddingoScraper:
             logger.warning(f"Error parsing tender element: {e}")
             return None
     
-    def _extract_text(self, element, selectors):
-        """Extract text from element using multiple selectors"""
-        for selector in selectors:
-            try:
-                found = element.find_element(By.CSS_SELECTOR, selector)
-                if found and found.text.strip():
-                    return found.text.strip()
-            except:
-                continue
-        return ""
-    
-    def _extract_tender_id(self, element, title):
-        """Extract tender ID from element or generate from title"""
-        # Try to find tender ID in various locations
-        id_selectors = [
-            ".tender-id", ".opportunity-id", ".bid-id", ".item-id",
-            ".listing-id", ".reference", ".ref", ".number"
-        ]
-        
-        for selector in id_selectors:
-            try:
-                found = element.find_element(By.CSS_SELECTOR, selector)
-                if found and found.text.strip():
-                    return found.text.strip()
-            except:
-                continue
-        
-        # Generate ID from title
-        return hashlib.md5(title.encode()).hexdigest()[:8]
-    
-    async def _extract_date(self, element, selectors):
-        """Extract date from element"""
-        for selector in selectors:
-            try:
-                found = element.find_element(By.CSS_SELECTOR, selector)
-                if found and found.text.strip():
-                    return parse_date(found.text.strip())
-            except:
-                continue
-        return None
-    
-    async def _extract_value(self, element):
-        """Extract monetary value from element"""
-        value_selectors = [
-            ".value", ".amount", ".budget", ".estimated-value",
-            ".contract-value", ".tender-value", ".bid-value"
-        ]
-        
-        for selector in value_selectors:
-            try:
-                found = element.find_element(By.CSS_SELECTOR, selector)
-                if found and found.text.strip():
-                    return parse_value(found.text.strip())
-            except:
-                continue
-        return 0.0
-    
-    def _extract_url(self, element):
-        """Extract tender URL from element"""
-        try:
-            # Look for links
-            links = element.find_elements(By.TAG_NAME, "a")
-            for link in links:
-                href = link.get_attribute('href')
-                if href and ('opportunity' in href or 'tender' in href or 'bid' in href):
-                    return href
-        except:
-            pass
-        
-        return self.base_url
-    
-    def _extract_keywords(self, title, description):
-        """Extract keywords from title and description"""
-        text = f"{title} {description}".lower()
-        keywords = []
-        
-        # Training-related keywords
-        training_keywords = [
-            'training', 'education', 'learning', 'development', 'workshop',
-            'seminar', 'course', 'certification', 'professional development',
-            'skill development', 'capacity building', 'upskilling', 'reskilling'
-        ]
-        
-        for keyword in training_keywords:
-            if keyword in text:
-                keywords.append(keyword)
-        
-        return keywords
-    
-    def _extract_matching_courses(self, title, description):
-        """Extract matching courses from title and description"""
+    def _analyze_content(self, title, description):
+        """Keywords, matching courses and priority for a tender's title and description"""
         text = f"{title} {description}".lower()
-        matching_courses = []
-        
-        # Map keywords to TKA courses
-        course_mapping = {
-            'project management': 'Project Management',
-            'leadership': 'Leadership',
-            'communication': 'Communication',
-            'negotiation': 'Negotiation',
-            'contract management': 'Contract Management',
-            'procurement': 'Procurement',
-            'supply chain': 'Supply Chain',
-            'risk management': 'Risk Management',
-            'strategic planning': 'Strategic Planning',
-            'change management': 'Change Management',
-            'team building': 'Team Building',
-            'conflict resolution': 'Conflict Resolution',
-            'time management': 'Time Management',
-            'problem solving': 'Problem Solving',
-            'decision making': 'Decision Making',
-            'financial management': 'Financial Management',
-            'human resources': 'Human Resources',
-            'marketing': 'Marketing',
-            'sales': 'Sales',
-            'customer service': 'Customer Service',
-            'quality management': 'Quality Management',
-            'process improvement': 'Process Improvement',
-            'innovation': 'Innovation',
-            'digital transformation': 'Digital Transformation',
-            'data analysis': 'Data Analysis',
-            'business intelligence': 'Business Intelligence',
-            'cybersecurity': 'Cybersecurity',
-            'cloud computing': 'Cloud Computing',
-            'agile': 'Agile',
-            'scrum': 'Scrum',
-            'lean six sigma': 'Lean Six Sigma',
-            'iso': 'ISO Standards',
-            'compliance': 'Compliance',
-            'regulatory': 'Regulatory Affairs'
+        return {
+            'keywords': _element_keywords(text),
+            'matching_courses': _element_courses(text),
+            'priority': _element_priority(text)
         }
-        
-        for keyword, course in course_mapping.items():
-            if keyword in text:
-                matching_courses.append(course)
-        
-        return matching_courses
-    
-    def _determine_priority(self, title, description):
-        """Determine priority based on content"""
-        text = f"{title} {description}".lower()
-        
-        # High priority keywords
-        high_priority = [
-            'training', 'education', 'learning', 'development', 'workshop',
-            'seminar', 'course', 'certification', 'professional development',
-            'consulting', 'advisory', 'implementation', 'change management'
-        ]
-        
-        # Medium priority keywords
-        medium_priority = [
-            'service', 'support', 'maintenance', 'management', 'administration',
-            'coordination', 'facilitation', 'delivery', 'provision'
-        ]
-        
-        for keyword in high_priority:
-            if keyword in text:
-                return 'high'
-        
-        for keyword in medium_priority:
-            if keyword in text:
-                return 'medium'
-        
-        return 'low'
     
     async def _go_to_next_page(self, driver):
         """Navigate to next page"""
@@ -3482,8 +3033,9 @@ class BiddingoScraper:
                 try:
                     next_btn = driver.find_element(By.CSS_SELECTOR, selector)
                     if next_btn and next_btn.is_displayed() and next_btn.is_enabled():
+                        previous_page = driver.find_element(By.TAG_NAME, "html")
                         driver.execute_script("arguments[0].click();", next_btn)
-                        await asyncio.sleep(3)
+                        wait_for_page_change(driver, previous_page)
                         logger.info("Navigated to next page")
                         return True
                 except:
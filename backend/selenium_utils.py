@@ -1,4 +1,10 @@
 # selenium_utils.py - Selenium Grid utilities with health checks and retry logic
+import itertools
+from collections import deque
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 import logging
 import time
 import random
@@ -13,13 +19,191 @@ from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException,
     SessionNotCreatedException,
-    NoSuchWindowException
+    NoSuchWindowException,
+    InvalidSessionIdException
 )
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Iterator, List, Tuple, Union
 import os
 
 logger = logging.getLogger(__name__)
 
+# Chrome arguments shared by every Grid driver; only the user agent varies
+_BASE_CHROME_ARGS = (
+    # Enhanced anti-bot evasion
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    # Additional stealth options
+    '--disable-extensions',
+    '--disable-plugins',
+    '--disable-images',
+    '--disable-javascript',
+    '--disable-web-security',
+    '--allow-running-insecure-content',
+    '--disable-features=VizDisplayCompositor',
+    # Window size
+    '--window-size=1920,1080',
+)
+
+_EXPERIMENTAL_OPTIONS = (
+    ("excludeSwitches", ["enable-automation"]),
+    ('useAutomationExtension', False),
+)
+
+# Chrome user agents handed out round-robin, one per new driver
+_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
+)
+_UA_CYCLE = itertools.cycle(_USER_AGENTS)
+
+@lru_cache(maxsize=256)
+def presence_of(by: str, value: str):
+    """Shared presence_of_element_located condition for a locator; the condition is stateless"""
+    return EC.presence_of_element_located((by, value))
+
+def retry_backoff(base: float, attempt: int, cap: float = 30.0) -> float:
+    """Seconds to wait before retrying after the given 0-based attempt: exponential, capped, jittered"""
+    return min(cap, base * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+# Resolves [kind, selector] pairs in the page; shared by find_many's wait and lookup
+_QUERY_JS = """
+const resolve = ([kind, selector]) => {
+    if (kind === 'css') return Array.from(document.querySelectorAll(selector));
+    const snapshot = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const nodes = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+    return nodes;
+};
+"""
+_FIND_MANY_JS = _QUERY_JS + "return arguments[0].map(resolve);"
+_ANY_MATCH_JS = _QUERY_JS + "return arguments[0].some(q => resolve(q).length > 0);"
+
+def _to_js_query(by: str, value: str) -> List[str]:
+    """Translate a Selenium locator into a [kind, selector] pair for _QUERY_JS"""
+    if by == By.CSS_SELECTOR:
+        return ['css', value]
+    if by == By.XPATH:
+        return ['xpath', value]
+    if by == By.ID:
+        return ['css', f'[id="{value}"]']
+    if by == By.CLASS_NAME:
+        return ['css', f'.{value}']
+    if by == By.TAG_NAME:
+        return ['css', value]
+    raise ValueError(f"{by}={value}")
+
+def find_many(driver: webdriver.Remote, queries: List[Tuple[str, str]], timeout: float = 10, poll_frequency: float = 0.2) -> List[list]:
+    """Wait once until any (by, value) query matches, then return one element list per query, in order"""
+    try:
+        js_queries = [_to_js_query(by, value) for by, value in queries]
+    except ValueError as e:
+        logger.error(f"Unsupported query for find_many: {e}")
+        return [[] for _ in queries]
+    
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=poll_frequency).until(
+            lambda d: d.execute_script(_ANY_MATCH_JS, js_queries)
+        )
+    except TimeoutException:
+        logger.warning(f"No elements found for {len(queries)} queries")
+        return [[] for _ in queries]
+    
+    try:
+        return driver.execute_script(_FIND_MANY_JS, js_queries)
+    except Exception as e:
+        logger.error(f"Error finding elements for {len(queries)} queries: {e}")
+        return [[] for _ in queries]
+
+# Reads text, href and visibility under one root element in the page. "first" maps
+# names to selector lists and gets the first match of each selector (or null);
+# "every" maps names to one selector and gets the text of all its matches
+_READ_ELEMENT_JS = """
+const [root, first, every, rootTextLimit, links] = arguments;
+const displayed = el => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+const text = el => displayed(el) ? el.innerText.trim() : '';
+const href = el => el.href !== undefined ? el.href : el.getAttribute('href');
+const describe = el => el && {text: text(el), href: href(el), displayed: displayed(el)};
+const mapValues = (obj, fn) => Object.fromEntries(Object.entries(obj).map(([name, value]) => [name, fn(value)]));
+// First n code points (not UTF-16 units), so the cut matches a Python slice
+const head = (s, n) => {
+    let end = 0, count = 0;
+    for (const ch of s) {
+        if (count++ === n) break;
+        end += ch.length;
+    }
+    return s.slice(0, end);
+};
+const rootInfo = describe(root);
+if (rootTextLimit !== null) rootInfo.text = head(rootInfo.text, rootTextLimit);
+return {
+    root: rootInfo,
+    first: mapValues(first, selectors => selectors.map(selector => describe(root.querySelector(selector)))),
+    every: mapValues(every, selector => Array.from(root.querySelectorAll(selector), text)),
+    links: mapValues(links, selector => Array.from(root.querySelectorAll(selector), href)),
+};
+"""
+
+def read_element(element, first: Dict[str, Tuple[str, ...]], every: Dict[str, str],
+                 root_text_limit: Optional[int] = None,
+                 links: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Read many CSS lookups under one element in a single WebDriver round trip
+    
+    Returns {'root': info, 'first': {name: [info or None per selector]},
+    'every': {name: [text per match]}, 'links': {name: [href per match]}}, where
+    info is {'text', 'href', 'displayed'}. Text is the rendered text like
+    WebElement.text, empty for hidden elements; href is the resolved link like
+    get_attribute('href'). root_text_limit cuts the root's text to that many
+    characters in the browser, so a large element's full text never crosses the wire.
+    """
+    return element.parent.execute_script(_READ_ELEMENT_JS, element, first, every, root_text_limit, links or {})
+
+def _page_replaced(previous_page):
+    """Condition: previous_page (an old <html> element) is detached and the new document has loaded"""
+    detached = EC.staleness_of(previous_page)
+    return lambda d: detached(d) and d.execute_script("return document.readyState") == "complete"
+
+def wait_for_page_change(driver: webdriver.Remote, previous_page: Any, timeout: float = 3.0) -> bool:
+    """Wait for an action to replace the page, returning as soon as the new one has loaded
+    
+    previous_page is the <html> element captured before the click or submit. An
+    in-page (AJAX) update never detaches it, so that case waits out the timeout.
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(_page_replaced(previous_page))
+        return True
+    except TimeoutException:
+        return False
+
+def wait_until_gone(driver: webdriver.Remote, element: Any, timeout: float = 1.0) -> bool:
+    """Wait for a clicked element (e.g. a consent banner button) to be hidden or removed"""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(EC.invisibility_of_element(element))
+        return True
+    except TimeoutException:
+        return False
+
+# Index of the first CSS selector with a match in the page, or -1; selectors the
+# browser rejects (e.g. jQuery's :contains) count as no match
+_FIRST_MATCH_JS = """
+return arguments[0].findIndex(selector => {
+    try { return document.querySelector(selector) !== null; } catch (e) { return false; }
+});
+"""
+
+def wait_for_any(driver: webdriver.Remote, selectors: List[str], timeout: float = 10, poll_frequency: float = 0.2) -> Optional[str]:
+    """Wait until any CSS selector matches; return the first matching one in list order, or None on timeout"""
+    try:
+        index = WebDriverWait(driver, timeout, poll_frequency=poll_frequency).until(
+            lambda d: d.execute_script(_FIRST_MATCH_JS, selectors) + 1
+        )
+        return selectors[index - 1]
+    except TimeoutException:
+        return None
+
 class SeleniumGridManager:
     """Manages Selenium Grid connections with health checks and retry logic"""
     
@@ -63,34 +247,13 @@ class SeleniumGridManager:
         """Get Chrome options with enhanced anti-bot measures"""
         options = Options()
         
-        # Enhanced anti-bot evasion
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        
-        # Random user agent rotation
-        user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
-        ]
-        options.add_argument(f'--user-agent={random.choice(user_agents)}')
+        for argument in _BASE_CHROME_ARGS:
+            options.add_argument(argument)
+        for name, value in _EXPERIMENTAL_OPTIONS:
+            options.add_experimental_option(name, value)
         
-        # Additional stealth options
-        options.add_argument('--disable-extensions')
-        options.add_argument('--disable-plugins')
-        options.add_argument('--disable-images')
-        options.add_argument('--disable-javascript')
-        options.add_argument('--disable-web-security')
-        options.add_argument('--allow-running-insecure-content')
-        options.add_argument('--disable-features=VizDisplayCompositor')
-        
-        # Window size
-        options.add_argument('--window-size=1920,1080')
+        # User agent rotation (round-robin across fingerprints)
+        options.add_argument(f'--user-agent={next(_UA_CYCLE)}')
         
         return options
     
@@ -103,7 +266,7 @@ class SeleniumGridManager:
                 # Check grid health before creating driver
                 if not self.check_grid_health():
                     logger.warning(f"Grid not healthy on attempt {attempt + 1}, waiting...")
-                    time.sleep(self.retry_delay * (attempt + 1))
+                    time.sleep(retry_backoff(self.retry_delay, attempt))
                     continue
                 
                 options = self.get_chrome_options()
@@ -120,12 +283,12 @@ class SeleniumGridManager:
             except SessionNotCreatedException as e:
                 logger.warning(f"Session creation failed on attempt {attempt + 1}: {e}")
                 if attempt < max_attempts - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
+                    time.sleep(retry_backoff(self.retry_delay, attempt))
                 continue
             except Exception as e:
-                logger.error(f"Driver creation failed on attempt {attempt + 1}: {e}")
+                logger.error(f"Driver creation failed on attempt {attempt + 1} ({type(e).__name__}): {e}")
                 if attempt < max_attempts - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
+                    time.sleep(retry_backoff(self.retry_delay, attempt))
                 continue
         
         logger.error("Failed to create WebDriver after all attempts")
@@ -165,12 +328,16 @@ class SeleniumGridManager:
             except TimeoutException:
                 logger.warning(f"Navigation timeout on attempt {attempt + 1}")
                 if attempt < max_attempts - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
+                    time.sleep(retry_backoff(self.retry_delay, attempt))
                 continue
+            except InvalidSessionIdException as e:
+                # The browser session is gone; retrying with it cannot succeed
+                logger.error(f"Navigation aborted, driver session is no longer valid: {e}")
+                return False
             except Exception as e:
-                logger.error(f"Navigation failed on attempt {attempt + 1}: {e}")
+                logger.error(f"Navigation failed on attempt {attempt + 1} ({type(e).__name__}): {e}")
                 if attempt < max_attempts - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
+                    time.sleep(retry_backoff(self.retry_delay, attempt))
                 continue
         
         logger.error(f"Failed to navigate to {url} after all attempts")
@@ -180,7 +347,7 @@ class SeleniumGridManager:
         """Safely find element with timeout"""
         try:
             element = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((by, value))
+                presence_of(by, value)
             )
             return element
         except TimeoutException:
@@ -194,7 +361,7 @@ class SeleniumGridManager:
         """Safely find elements with timeout"""
         try:
             WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((by, value))
+                presence_of(by, value)
             )
             elements = driver.find_elements(by, value)
             return elements
@@ -204,6 +371,159 @@ class SeleniumGridManager:
         except Exception as e:
             logger.error(f"Error finding elements {by}={value}: {e}")
             return []
+    
+    def find_many(self, driver: webdriver.Remote, queries: List[Tuple[str, str]], timeout: int = 10) -> List[list]:
+        """Find elements for several (by, value) queries in one browser round-trip
+        
+        Waits once until any query matches, then returns one list of elements per
+        query, in order.
+        """
+        return find_many(driver, queries, timeout)
+    
+    def wait_for_page_change(self, driver: webdriver.Remote, previous_page: Any, timeout: float = 3.0) -> bool:
+        """Wait for an action to replace the page, returning as soon as the new one has loaded
+        
+        previous_page is the <html> element captured before the click or submit. An
+        in-page (AJAX) update never detaches it, so that case waits out the timeout.
+        """
+        return wait_for_page_change(driver, previous_page, timeout)
+
+class DriverPool:
+    """Pool of Chrome drivers reused across scrapes
+    
+    Works with any manager exposing create_driver() and safe_quit_driver(), i.e.
+    SeleniumGridManager or LocalSeleniumManager. Released drivers are reset
+    (cookies cleared, blank page) and kept for the next acquire instead of being
+    quit, so a browser session is not started per scrape.
+    
+    max_size caps the idle drivers kept, not the drivers checked out: a checkout
+    with none idle always creates one, and releases beyond max_size quit the
+    driver. Callers bound concurrent use (e.g. SCAN_SELENIUM_CONCURRENCY). With
+    idle_ttl, drivers parked longer than that many seconds are quit on the next
+    checkout or release instead of holding a browser session.
+    """
+    
+    def __init__(self, manager: Any, max_size: int = 4, warm: int = 0, idle_ttl: Optional[float] = None):
+        self.manager = manager
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        # (parked at, driver), oldest first; checkouts take the most recently used
+        self._idle: deque = deque()
+        self._lock = threading.Lock()
+        if warm:
+            self.warm(warm)
+    
+    def warm(self, count: int) -> int:
+        """Start up to count drivers in parallel and park them in the pool
+        
+        Chrome start-up is mostly waiting on the child process, so drivers are
+        created concurrently. Failed starts are skipped; returns how many were added.
+        """
+        with self._lock:
+            count = min(count, self.max_size - len(self._idle))
+        if count <= 0:
+            return 0
+        
+        added = 0
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            for driver in executor.map(lambda _: self.manager.create_driver(), range(count)):
+                if driver is None:
+                    continue
+                if self._park(driver):
+                    added += 1
+                else:
+                    self.manager.safe_quit_driver(driver)
+        
+        logger.info(f"Warmed driver pool with {added}/{count} drivers")
+        return added
+    
+    def checkout(self) -> Optional[webdriver.Remote]:
+        """Take an idle driver or create a new one, None if creation fails; pair with release()"""
+        driver = self._take_idle()
+        if driver is None:
+            driver = self.manager.create_driver()
+        return driver
+    
+    @contextmanager
+    def acquire(self) -> Iterator[webdriver.Remote]:
+        """Borrow a driver for the duration of a with-block"""
+        driver = self.checkout()
+        if driver is None:
+            raise RuntimeError("Failed to create WebDriver")
+        
+        reusable = True
+        try:
+            yield driver
+        except (SessionNotCreatedException, InvalidSessionIdException):
+            # The browser session may be gone; don't hand it out again
+            reusable = False
+            raise
+        finally:
+            if reusable:
+                self.release(driver)
+            else:
+                self.manager.safe_quit_driver(driver)
+    
+    def _park(self, driver: webdriver.Remote) -> bool:
+        """Keep a driver as the most recently used idle one; False if the pool is full"""
+        with self._lock:
+            if len(self._idle) >= self.max_size:
+                return False
+            self._idle.append((time.monotonic(), driver))
+            return True
+    
+    def _quit_expired(self) -> None:
+        """Quit the drivers parked longer than idle_ttl"""
+        if self.idle_ttl is None:
+            return
+        cutoff = time.monotonic() - self.idle_ttl
+        expired = []
+        with self._lock:
+            while self._idle and self._idle[0][0] <= cutoff:
+                expired.append(self._idle.popleft()[1])
+        for driver in expired:
+            logger.info(f"Quitting driver idle for over {self.idle_ttl:g}s")
+            self.manager.safe_quit_driver(driver)
+    
+    def _take_idle(self) -> Optional[webdriver.Remote]:
+        """Pop the most recently used idle driver that still answers, quitting dead ones
+        
+        Grid nodes end sessions left idle past their timeout, so a parked driver
+        is probed with a cheap command before it is handed out.
+        """
+        self._quit_expired()
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                _, driver = self._idle.pop()
+            try:
+                driver.current_url
+                return driver
+            except WebDriverException as e:
+                logger.info(f"Dropping pooled driver whose session ended: {type(e).__name__}")
+                self.manager.safe_quit_driver(driver)
+    
+    def release(self, driver: webdriver.Remote) -> None:
+        """Reset a driver and return it to the pool, quitting it if the pool is full"""
+        self._quit_expired()
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except Exception as e:
+            logger.warning(f"Discarding driver that failed to reset: {e}")
+            self.manager.safe_quit_driver(driver)
+            return
+        if not self._park(driver):
+            self.manager.safe_quit_driver(driver)
+    
+    def close(self) -> None:
+        """Quit every idle driver; the pool stays usable and starts new ones on demand"""
+        with self._lock:
+            drivers = [driver for _, driver in self._idle]
+            self._idle.clear()
+        for driver in drivers:
+            self.manager.safe_quit_driver(driver)
 
 # Global selenium manager instance
 selenium_manager = None
@@ -228,4 +548,32 @@ def get_driver():
     if driver is None:
         raise RuntimeError("Failed to create WebDriver")
     
-    return driver 
\ No newline at end of file
+    return driver 
+
+# Global Grid driver pool; first requested from several scan threads at once
+grid_driver_pool = None
+_grid_driver_pool_lock = threading.Lock()
+
+def get_grid_driver_pool() -> DriverPool:
+    """Get or create this process's Grid driver pool
+    
+    Keeps up to GRID_DRIVER_POOL_SIZE idle drivers, each for at most
+    GRID_DRIVER_IDLE_TTL seconds. Every process (the API and each Celery worker
+    child) has its own pool, so the size is a share of a budget summed across
+    them: all the parked sessions together must leave room in the Grid's
+    capacity (2 Chrome nodes x 3 sessions in docker-compose) for new drivers.
+    Scans drain the pool when they finish.
+    """
+    global grid_driver_pool
+    if grid_driver_pool is None:
+        with _grid_driver_pool_lock:
+            if grid_driver_pool is None:
+                max_size = int(os.getenv('GRID_DRIVER_POOL_SIZE', '2'))
+                idle_ttl = float(os.getenv('GRID_DRIVER_IDLE_TTL', '120'))
+                grid_driver_pool = DriverPool(get_selenium_manager(), max_size=max_size, idle_ttl=idle_ttl)
+    return grid_driver_pool
+
+def close_grid_driver_pool() -> None:
+    """Quit the Grid pool's idle drivers, if the pool was ever created"""
+    if grid_driver_pool is not None:
+        grid_driver_pool.close()
@@ -9,7 +9,7 @@ from typing import Any, TYPE_CHECKING, Callable, Union
 import asyncio
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-import json
+from collections import defaultdict
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -18,9 +18,15 @@ from email import encoders
 import pandas as pd
 from pathlib import Path
 from sqlalchemy import desc
-import aiohttp
 from aiohttp import ClientSession
 
+# Run scan coroutines on uvloop when installed (it ships with uvicorn[standard])
+try:
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
 # Type checking imports
 if TYPE_CHECKING:
     from celery import Task
@@ -30,18 +36,20 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Import from models module
-from models import SessionLocal, Tender, save_tender_to_db
+from models import SessionLocal, Tender, async_portal_scan_lock, save_tenders_to_db
 
 # Import from config and matcher modules (instead of main)
-from config import PORTAL_CONFIGS, TKA_COURSES
+from config import PORTAL_CONFIGS, TKA_COURSES, get_portals
 from matcher import TenderMatcher
+from selenium_utils import close_grid_driver_pool, get_grid_driver_pool
 
 # Import from scrapers module
 from scrapers import (
     ProvincialScrapers,
     MunicipalScrapers,
     SpecializedScrapers,
-    HealthEducationScrapers
+    HealthEducationScrapers,
+    create_http_session
 )
 
 # Import ProcurementScanner from main (lazy import to avoid circular dependency)
@@ -183,18 +191,13 @@ def _process_tenders(tenders: list[dict], portal_name: str, results: dict, match
     portal_results['found'] += len(tenders)
     
     try:
-        for tender_data in tenders:
-            tender_data['matching_courses'] = matcher.match_courses(tender_data)
-            tender_data['priority'] = matcher.calculate_priority(tender_data)
-
-            was_new = save_tender_to_db(db, tender_data)
+        matcher.annotate(tenders)
+        new_count, updated_count = save_tenders_to_db(db, tenders)
 
-            if was_new:
-                portal_results['new'] += 1
-                results['new_tenders'] += 1
-            else:
-                portal_results['updated'] += 1
-                results['updated_tenders'] += 1
+        portal_results['new'] += new_count
+        results['new_tenders'] += new_count
+        portal_results['updated'] += updated_count
+        results['updated_tenders'] += updated_count
 
         results['total_found'] += len(tenders)
         results['by_portal'][portal_name] = portal_results
@@ -204,168 +207,144 @@ def _process_tenders(tenders: list[dict], portal_name: str, results: dict, match
         db.close()
 
 
-async def _execute_scans_async(portal_ids: list[str], results: dict, matcher: TenderMatcher):
-    """
-    The async helper that iterates through portals and calls the correct scraper function.
+# Portals scanned at once per task. Selenium scrapers each hold a Grid session and
+# run in a worker thread; HTTP scrapers share the task's pooled aiohttp session.
+SCAN_SELENIUM_CONCURRENCY = int(os.getenv('SCAN_SELENIUM_CONCURRENCY', '6'))
+SCAN_HTTP_CONCURRENCY = int(os.getenv('SCAN_HTTP_CONCURRENCY', '8'))
+
+
+def _run_in_worker(call: Callable[..., Any], with_driver: bool) -> Any:
+    """Run a blocking scraper call to completion in the current worker thread
+    
+    The async Selenium scrapers block on WebDriver calls, so each one gets its own
+    event loop here. With with_driver, the call borrows a pooled Grid session.
     """
-    # Lazy import to avoid circular dependency
-    scanner = get_procurement_scanner()
-    driver = None
-    db_session = SessionLocal()  # Use SessionLocal for DB session
+    def run(*args):
+        result = call(*args)
+        return asyncio.run(result) if asyncio.iscoroutine(result) else result
     
-    # Create HTTP session for session-only scrapers
-    async with aiohttp.ClientSession() as http_session:
-        for portal_id in portal_ids:
-            if portal_id not in PORTAL_CONFIGS:
-                logger.warning(f"Configuration for portal_id '{portal_id}' not found. Skipping.")
-                continue
-
-            config = PORTAL_CONFIGS[portal_id]
-            portal_type = config.get('type')
-            scraper_func_ref = SCRAPER_DISPATCHER.get(portal_id)
-
-            # Handle special portal types
-            if portal_type == 'api':
-                # API-based portals like CanadaBuys
-                try:
-                    logger.info(f"Scanning {config['name']} via API")
-                    tenders = await scanner.scan_canadabuys()
-                    if tenders:
-                        _process_tenders(tenders, config['name'], results, matcher)
-                    # Ensure results['scanned'] and results['errors'] are lists before appending
-                    if not isinstance(results['scanned'], list):
-                        results['scanned'] = []
-                    results['scanned'].append(portal_id)
-                except Exception as e:
-                    logger.error(f"Error scanning {config['name']} API: {e}")
-                    # Ensure results['errors'] is a list before appending
-                    if not isinstance(results['errors'], list):
-                        results['errors'] = []
-                    results['errors'].append({'portal': config['name'], 'error': str(e)})
-                continue
-                
-            elif portal_type == 'bidsandtenders':
-                # bids&tenders platform
-                try:
-                    logger.info(f"Scanning {config['name']} via bids&tenders platform")
-                    tenders = await scanner.scan_bidsandtenders_portal(config['name'], config['search_url'])  # type: ignore[arg-type]
-                    if tenders:
-                        _process_tenders(tenders, config['name'], results, matcher)  # type: ignore[arg-type]
-                    # Ensure results['scanned'] and results['errors'] are lists before appending
-                    if not isinstance(results['scanned'], list):
-                        results['scanned'] = []
-                    results['scanned'].append(portal_id)
-                except Exception as e:
-                    logger.error(f"Error scanning {config['name']}: {e}")
-                    # Ensure results['errors'] is a list before appending
-                    if not isinstance(results['errors'], list):
-                        results['errors'] = []
-                    results['errors'].append({'portal': config['name'], 'error': str(e)})  # type: ignore[arg-type]
-                continue
-
-            # Handle dispatcher-based scrapers
-            if isinstance(scraper_func_ref, str) and scraper_func_ref in SCRAPER_DISPATCHER:
-                scraper_func_ref = SCRAPER_DISPATCHER.get(scraper_func_ref)
-
-            # Ensure we have a callable function
-            if not scraper_func_ref or not callable(scraper_func_ref):
-                logger.warning(f"No valid scraper function found for portal: {portal_id}")
-                continue
-
-            # Type assertion to ensure scraper_func_ref is callable
-            scraper_func = scraper_func_ref  # type: ignore[assignment]
-            if not hasattr(scraper_func, '__call__'):
-                logger.warning(f"Scraper function for portal {portal_id} is not callable")
-                continue
-
-            try:
-                logger.info(f"Scanning portal: {config['name']}")
-                tenders: Any = []
-                
-                # Determine if portal needs Selenium based on type
-                needs_selenium = portal_type == 'web' or config.get('requires_selenium', False)
-                
-                if needs_selenium:
-                    if driver is None:
-                        driver = scanner.selenium.create_driver()
-                    
-                    # Check if the function is a method of the scanner instance
-                    if hasattr(scanner, scraper_func.__name__):
-                        method_to_call = getattr(scanner, scraper_func.__name__)
-                        # Handle methods that need extra arguments
-                        if scraper_func.__name__ in ['scan_ariba_portal', 'scan_biddingo']:
-                            tenders = await method_to_call(config['name'], config)
-                        elif scraper_func.__name__ in ['scan_canadabuys', 'scan_merx', 'scan_bcbid', 'scan_seao_web', 'scan_bidsandtenders_portal']:
-                            # These expect driver and selenium_helper
-                            tenders = await method_to_call(driver, scanner.selenium)
-                        else:
-                            # Most other methods expect no arguments
-                            tenders = await method_to_call()
-                    else: # Static method from scrapers.py
-                        # Check if this is a session-only scraper
-                        if scraper_func in SESSION_ONLY_SCRAPERS.values():
-                            # Session-only scrapers expect HTTP session
-                            if asyncio.iscoroutinefunction(scraper_func):
-                                tenders = await scraper_func(http_session)  # type: ignore
-                            else:
-                                loop = asyncio.get_event_loop()
-                                tenders = await loop.run_in_executor(None, lambda: scraper_func(http_session))  # type: ignore
-                        else:
-                            # Non-session scrapers still need driver and selenium_helper
-                            if driver is None:
-                                driver = scanner.selenium.create_driver()
-                            if asyncio.iscoroutinefunction(scraper_func):
-                                tenders = await scraper_func(driver, scanner.selenium)  # type: ignore
-                            else:
-                                loop = asyncio.get_event_loop()
-                                tenders = await loop.run_in_executor(None, lambda: scraper_func(driver, scanner.selenium))  # type: ignore
-                else: # Non-selenium static method
-                    # Check if this is a session-only scraper
-                    if scraper_func in SESSION_ONLY_SCRAPERS.values():
-                        # Session-only scrapers expect HTTP session
-                        if asyncio.iscoroutinefunction(scraper_func):
-                            tenders = await scraper_func(http_session)  # type: ignore
-                        else:
-                            loop = asyncio.get_event_loop()
-                            tenders = await loop.run_in_executor(None, lambda: scraper_func(http_session))  # type: ignore
-                    else:
-                        # Non-session scrapers still need driver and selenium_helper
-                        if driver is None:
-                            driver = scanner.selenium.create_driver()
-                        if asyncio.iscoroutinefunction(scraper_func):
-                            tenders = await scraper_func(driver, scanner.selenium)  # type: ignore
-                        else:
-                            loop = asyncio.get_event_loop()
-                            tenders = await loop.run_in_executor(None, lambda: scraper_func(driver, scanner.selenium))  # type: ignore
-                
+    if not with_driver:
+        return run()
+    with get_grid_driver_pool().acquire() as driver:
+        return run(driver)
+
+
+async def _scan_portal_async(portal_id: str, scanner, http_session: ClientSession,
+                             slots: dict, results: dict, matcher: TenderMatcher):
+    """Scan one portal with its scraper and record the outcome in results"""
+    if portal_id not in PORTAL_CONFIGS:
+        logger.warning(f"Configuration for portal_id '{portal_id}' not found. Skipping.")
+        return
+
+    config = PORTAL_CONFIGS[portal_id]
+    portal_type = config.type
+    session_scraper = None
+    with_driver = False
+
+    # Handle special portal types
+    if portal_type == 'api':
+        # API-based portals like CanadaBuys
+        description = f"{config.name} via API"
+        call: Callable[..., Any] = lambda: scanner.scan_canadabuys()
+    elif portal_type == 'bidsandtenders':
+        description = f"{config.name} via bids&tenders platform"
+        call = lambda: scanner.scan_bidsandtenders_portal(config.name, config.search_url)
+    else:
+        # Handle dispatcher-based scrapers
+        scraper_func = SCRAPER_DISPATCHER.get(portal_id)
+        if isinstance(scraper_func, str) and scraper_func in SCRAPER_DISPATCHER:
+            scraper_func = SCRAPER_DISPATCHER.get(scraper_func)
+        if not scraper_func or not callable(scraper_func):
+            logger.warning(f"No valid scraper function found for portal: {portal_id}")
+            return
+
+        description = f"portal: {config.name}"
+        needs_selenium = portal_type == 'web' or config.requires_selenium
+        with_driver = True
+        if needs_selenium and hasattr(scanner, scraper_func.__name__):
+            method_to_call = getattr(scanner, scraper_func.__name__)
+            # Handle methods that need extra arguments
+            if scraper_func.__name__ in ['scan_ariba_portal', 'scan_biddingo']:
+                call = lambda driver: method_to_call(config.name, config.to_dict())
+            elif scraper_func.__name__ in ['scan_canadabuys', 'scan_merx', 'scan_bcbid', 'scan_seao_web', 'scan_bidsandtenders_portal']:
+                # These expect driver and selenium_helper
+                call = lambda driver: method_to_call(driver, scanner.selenium)
+            else:
+                # Most other methods expect no arguments
+                call = lambda driver: method_to_call()
+        elif scraper_func in SESSION_ONLY_SCRAPERS.values():
+            # Session-only scrapers expect HTTP session
+            session_scraper = scraper_func
+            with_driver = False
+            call = lambda: scraper_func(http_session)
+        else:
+            # Non-session scrapers need driver and selenium_helper
+            call = lambda driver: scraper_func(driver, scanner.selenium)
+
+    async with slots['http' if session_scraper else 'selenium']:
+        # The lock sits inside the try: a lock or scrape failure is this portal's
+        # error and never aborts the other portals' scans
+        try:
+            async with async_portal_scan_lock(portal_id) as acquired:
+                if not acquired:
+                    logger.info(f"Skipping portal '{portal_id}': already being scanned by another process")
+                    return
+                logger.info(f"Scanning {description}")
+                if session_scraper is not None and asyncio.iscoroutinefunction(session_scraper):
+                    # Awaited on this loop, where the shared HTTP session lives
+                    tenders = await call()
+                else:
+                    tenders = await asyncio.to_thread(_run_in_worker, call, with_driver)
+
                 if tenders:
                     # Ensure tenders is a list before processing
                     if isinstance(tenders, list):
-                        _process_tenders(tenders, config['name'], results, matcher)  # type: ignore[arg-type]
+                        _process_tenders(tenders, config.name, results, matcher)
                     else:
-                        logger.warning(f"Unexpected tenders type for {config['name']}: {type(tenders)}")
-                # Ensure results['scanned'] and results['errors'] are lists before appending
-                if not isinstance(results['scanned'], list):
-                    results['scanned'] = []
+                        logger.warning(f"Unexpected tenders type for {config.name}: {type(tenders)}")
                 results['scanned'].append(portal_id)
+        except Exception as e:
+            logger.error(f"Error scanning {config.name}: {e}", exc_info=True)
+            results['errors'].append({'portal': config.name, 'error': str(e)})
 
-            except Exception as e:
-                logger.error(f"Error scanning {config['name']}: {e}", exc_info=True)
-                # Ensure results['errors'] is a list before appending
-                if not isinstance(results['errors'], list):
-                    results['errors'] = []
-                results['errors'].append({'portal': config['name'], 'error': str(e)})  # type: ignore[arg-type]
-            
-        if driver:
-            driver.quit()
-        db_session.close()
+
+async def _execute_scans_async(portal_ids: list[str], results: dict, matcher: TenderMatcher):
+    """
+    The async helper that scans the given portals concurrently with the correct scraper functions.
+    
+    Each portal holds its scan lock while it runs, so a portal that another worker
+    or the API is already scanning is skipped.
+    """
+    # Lazy import to avoid circular dependency
+    scanner = get_procurement_scanner()
+    slots = {
+        'selenium': asyncio.Semaphore(SCAN_SELENIUM_CONCURRENCY),
+        'http': asyncio.Semaphore(SCAN_HTTP_CONCURRENCY),
+    }
+    
+    # Create HTTP session for session-only scrapers
+    try:
+        async with create_http_session() as http_session:
+            outcomes = await asyncio.gather(*(
+                _scan_portal_async(portal_id, scanner, http_session, slots, results, matcher)
+                for portal_id in portal_ids
+            ), return_exceptions=True)
+    finally:
+        # Hand this worker child's parked Grid sessions back between tasks
+        await asyncio.to_thread(close_grid_driver_pool)
+    
+    # Anything escaping _scan_portal_async is recorded against its portal only
+    for portal_id, outcome in zip(portal_ids, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(f"Error scanning portal '{portal_id}': {outcome}")
+            results['errors'].append({'portal': portal_id, 'error': str(outcome)})
 
 
 @app.task(bind=True, max_retries=3)
 def scan_specific_portals_task(self, portal_ids: list[str]):
     """The new master task that scans a specific list of portals using the dispatcher."""
     scanner = get_procurement_scanner()
-    loop = asyncio.new_event_loop()
+    loop = _new_event_loop()
     asyncio.set_event_loop(loop)
     
     results = {'scanned': [], 'total_found': 0, 'new_tenders': 0, 'updated_tenders': 0, 'errors': [], 'by_portal': {}}
@@ -401,14 +380,14 @@ def scan_high_priority_portals():
 @app.task
 def scan_api_portals():
     """Scan portals with API access for real-time updates."""
-    api_portal_ids = [k for k,v in PORTAL_CONFIGS.items() if v.get('type') in ['api', 'api_and_scrape']]
+    api_portal_ids = [*get_portals(type='api'), *get_portals(type='api_and_scrape')]
     return app.send_task('tasks.scan_specific_portals_task', args=[api_portal_ids])
 
 
 @app.task
 def scan_municipal_portals():
     """Scan all municipal portals."""
-    municipal_ids = [k for k,v in PORTAL_CONFIGS.items() if 'City of' in v['name'] or 'Municipality' in v['name']]
+    municipal_ids = [k for k,v in PORTAL_CONFIGS.items() if 'City of' in v.name or 'Municipality' in v.name]
     return app.send_task('tasks.scan_specific_portals_task', args=[municipal_ids])
 
 
@@ -417,8 +396,8 @@ def scan_provincial_portals():
     """Scan all provincial portals."""
     provincial_keywords = ['Province', 'Provincial', 'Government', 'Tenders', 'Purchasing Connection', 'Opportunities Network']
     provincial_ids = [k for k,v in PORTAL_CONFIGS.items() 
-                      if any(keyword in v['name'] for keyword in provincial_keywords) 
-                      and 'City' not in v['name']]
+                      if any(keyword in v.name for keyword in provincial_keywords) 
+                      and 'City' not in v.name]
     return app.send_task('tasks.scan_specific_portals_task', args=[provincial_ids])
 
 
@@ -553,7 +532,7 @@ def generate_tender_table(tenders):
     rows = []
     for tender in tenders:
         priority_class = tender.priority if tender.priority in ['high', 'medium'] else ''
-        matching_courses = json.loads(tender.matching_courses) if tender.matching_courses else []
+        matching_courses = tender.matching_courses or []
         
         rows.append(f"""
         <tr>
@@ -652,19 +631,12 @@ def generate_weekly_summary():
             Tender.posted_date.isnot(None),  # type: ignore[reportAttributeAccessIssue]
             Tender.posted_date >= week_start
         ).all()
-        category_counts = {}
+        category_counts = defaultdict(int)
         for tender in tenders:
-            categories_str = tender.categories
-            if categories_str is not None and str(categories_str).strip() != '':
-                try:
-                    categories = json.loads(str(categories_str))
-                    for cat in categories:
-                        category_counts[cat] = category_counts.get(cat, 0) + 1
-                except (json.JSONDecodeError, TypeError):
-                    # Handle case where categories is not valid JSON
-                    continue
-        
-        weekly_stats['by_category'] = category_counts
+            for cat in tender.categories or []:
+                category_counts[cat] += 1
+        
+        weekly_stats['by_category'] = dict(category_counts)
         
         # Get the count of portals from the query result
         portal_count = len(weekly_stats['by_portal']) if isinstance(weekly_stats['by_portal'], list) else 0
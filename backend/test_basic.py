@@ -6,6 +6,7 @@ Basic tests for the procurement scanner
 import pytest
 import sys
 import os
+from datetime import datetime
 
 # Add the backend directory to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -24,6 +25,201 @@ def test_imports():
     except ImportError as e:
         pytest.fail(f"Failed to import selenium_utils: {e}")
 
+def test_match_courses():
+    """Test that course matching is case-insensitive and keeps TKA_COURSES order"""
+    from matcher import TenderMatcher
+    
+    tender = {
+        'title': 'AGILE coaching and project management',
+        'description': 'Includes change management for staff'
+    }
+    assert TenderMatcher.match_courses(tender) == ['Project Management', 'Change Management', 'Agile']
+    assert TenderMatcher.match_courses({'title': 'Snow removal'}) == []
+
+def test_annotate_sets_courses_and_priority():
+    """Test that annotate derives the fields both scan paths store"""
+    from matcher import TenderMatcher
+    
+    tenders = [{'title': 'Agile coaching', 'description': '', 'value': 2000000, 'portal': 'MERX'}]
+    TenderMatcher.annotate(tenders)
+    assert tenders[0]['matching_courses'] == ['Agile']
+    assert tenders[0]['priority'] == 'high'
+
+def _tender(tender_id, title):
+    return {
+        'tender_id': tender_id, 'title': title, 'organization': 'City', 'portal': 'MERX',
+        'value': 1000.0, 'closing_date': None, 'description': '', 'tender_url': f'https://example.com/{tender_id}'
+    }
+
+def test_save_tenders_to_db_inserts_updates_and_skips():
+    """Test the batched upsert against an in-memory SQLite database"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from models import Base, Tender, save_tenders_to_db
+    
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    
+    # A repeated id in one batch is stored once, the later copy winning
+    assert save_tenders_to_db(db, [_tender('A', 'First'), _tender('B', 'Old title'), _tender('B', 'Second')]) == (2, 1)
+    assert db.query(Tender).count() == 2
+    assert db.get(Tender, 'B').title == 'Second'
+    
+    stored = {tender.tender_id: (tender.hash, tender.last_updated) for tender in db.query(Tender)}
+    db.expire_all()
+    
+    # Nothing new: every tender counts as updated, but only the changed one is rewritten
+    assert save_tenders_to_db(db, [_tender('A', 'First'), _tender('B', 'Renamed')]) == (0, 2)
+    unchanged, changed = db.get(Tender, 'A'), db.get(Tender, 'B')
+    assert (unchanged.hash, unchanged.last_updated) == stored['A']
+    assert changed.title == 'Renamed'
+    assert changed.hash != stored['B'][0]
+    db.close()
+
+def test_async_portal_scan_lock_runs_off_the_event_loop(monkeypatch):
+    """Test that the scan lock is taken and released in a worker thread, also when the scan fails"""
+    import asyncio
+    import contextlib
+    import threading
+    import models
+    
+    threads = []
+    
+    @contextlib.contextmanager
+    def fake_lock(portal):
+        threads.append(('enter', portal, threading.get_ident()))
+        try:
+            yield True
+        finally:
+            threads.append(('exit', portal, threading.get_ident()))
+    
+    monkeypatch.setattr(models, 'portal_scan_lock', fake_lock)
+    
+    async def scan():
+        async with models.async_portal_scan_lock('ns') as acquired:
+            assert acquired
+            raise RuntimeError('scrape failed')
+    
+    async def run():
+        loop_thread = threading.get_ident()
+        with pytest.raises(RuntimeError):
+            await scan()
+        return loop_thread
+    
+    loop_thread = asyncio.run(run())
+    assert [(step, portal) for step, portal, _ in threads] == [('enter', 'ns'), ('exit', 'ns')]
+    assert all(thread != loop_thread for _, _, thread in threads)
+
+def test_driver_pool_quits_drivers_idle_past_ttl(monkeypatch):
+    """Test that parked drivers older than idle_ttl are quit instead of handed out"""
+    import selenium_utils
+    from selenium_utils import DriverPool
+    
+    class FakeDriver:
+        current_url = 'about:blank'
+        def delete_all_cookies(self): pass
+        def get(self, url): pass
+    
+    class FakeManager:
+        def __init__(self):
+            self.quit = []
+        def create_driver(self):
+            return FakeDriver()
+        def safe_quit_driver(self, driver):
+            self.quit.append(driver)
+    
+    clock = [0.0]
+    monkeypatch.setattr(selenium_utils.time, 'monotonic', lambda: clock[0])
+    manager = FakeManager()
+    pool = DriverPool(manager, max_size=2, idle_ttl=60)
+    
+    old, recent = pool.checkout(), pool.checkout()
+    pool.release(old)
+    clock[0] = 50.0
+    pool.release(recent)
+    
+    # At t=100 the driver parked at t=0 has expired; the one parked at t=50 has not
+    clock[0] = 100.0
+    assert pool.checkout() is recent
+    assert manager.quit == [old]
+    
+    pool.release(recent)
+    pool.close()
+    assert manager.quit == [old, recent]
+
+def test_keywords_contains_uses_jsonb_containment():
+    """Test that JSON list containment compiles to @> on PostgreSQL, which the GIN index serves"""
+    from sqlalchemy.dialects import postgresql
+    from models import Tender
+    
+    compiled = Tender.keywords.contains(['pmp']).compile(dialect=postgresql.dialect())
+    assert str(compiled) == 'tenders.keywords @> %(keywords_1)s'
+    assert compiled.params == {'keywords_1': ['pmp']}
+
+@pytest.mark.parametrize('text', [
+    'professional development and software development',
+    'agile coaching for project management teams',
+    'developer training',
+    'snow removal',
+    '',
+])
+def test_keyword_finder_matches_substring_scan(text):
+    """Test that overlapping and nested keywords are found exactly as `kw in text` finds them"""
+    from scrapers import keyword_finder
+    
+    keywords = ['development', 'professional development', 'software development', 'dev',
+                'agile', 'agile coaching', 'coach', 'management', 'project management', 'train']
+    assert keyword_finder(keywords)(text) == {kw for kw in keywords if kw in text}
+
+@pytest.mark.parametrize('date_str, expected', [
+    ('2024-03-15', datetime(2024, 3, 15)),
+    ('2024-03-15 14:30:00', datetime(2024, 3, 15, 14, 30)),
+    ('2024-03-15T14:30:00Z', datetime(2024, 3, 15, 14, 30)),
+    ('15/03/2024', datetime(2024, 3, 15)),
+    ('03/25/2024', datetime(2024, 3, 25)),
+    ('25-12-2024', datetime(2024, 12, 25)),
+    ('15-Mar-2024', datetime(2024, 3, 15)),
+    ('5 Mar 2024', datetime(2024, 3, 5)),
+    ('15 March 2024', datetime(2024, 3, 15)),
+    ('15 Mar 2024 02:30 PM', datetime(2024, 3, 15, 14, 30)),
+    ('March 15, 2024', datetime(2024, 3, 15)),
+    ('Mar 15, 2024', datetime(2024, 3, 15)),
+])
+def test_parse_date_tries_the_formats_a_string_can_match(date_str, expected):
+    """Test that each date shape is dispatched to a format group that parses it"""
+    from scrapers import parse_date
+    
+    assert parse_date(date_str) == expected
+
+@pytest.mark.parametrize('date_text, expected', [
+    ('March 15, 2024', '2024-03-15T00:00:00'),
+    ('Mar 15, 2024', '2024-03-15T00:00:00'),
+    ('2024-03-15', '2024-03-15T00:00:00'),
+    ('03/25/2024', '2024-03-25T00:00:00'),
+    ('25/03/2024', '2024-03-25T00:00:00'),
+    ('Closing soon', None),
+])
+def test_parse_card_date(date_text, expected):
+    """Test listing card dates across the name, year and number format groups"""
+    from scrapers import _parse_card_date
+    
+    assert _parse_card_date(date_text) == expected
+
+@pytest.mark.parametrize('value_text, expected', [
+    ('$250K', 250000),
+    ('$2M', 2000000),
+    ('$1B', 1000000000),
+    ('$12,500', 12500),
+    ('$500 CAD', 500),
+    ('No value', 0),
+])
+def test_parse_card_value(value_text, expected):
+    """Test card amounts with thousands separators and K/M/B multipliers"""
+    from scrapers import _parse_card_value
+    
+    assert _parse_card_value(value_text) == expected
+
 def test_basic_functionality():
     """Test basic functionality"""
     assert True  # Placeholder test
@@ -64,7 +64,7 @@ try:
     from config import PORTAL_CONFIGS
     print(f"✓ Found {len(PORTAL_CONFIGS)} portal configurations")
     for portal_name, config in PORTAL_CONFIGS.items():
-        print(f"  - {portal_name}: {config.get('url', 'No URL')}")
+        print(f"  - {portal_name}: {config.url or 'No URL'}")
 except Exception as e:
     print(f"✗ Failed to load portal configurations: {e}")
 
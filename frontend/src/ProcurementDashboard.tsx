@@ -33,6 +33,14 @@ type Stats = {
     last_scan: string | null;
 };
 
+const CSV_HEADER = 'ID,Title,Organization,Portal,Value,Closing Date,Location,Priority,Matching Courses,URL\n';
+
+// Quote a CSV field only when it contains a comma, quote or line break
+const csvField = (value: string | number | null): string => {
+  const text = String(value ?? '');
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+};
+
 const ProcurementDashboard: React.FC = () => {
   // Use the new types to define our state
   const [tenders, setTenders] = useState<Tender[]>([]);
@@ -163,23 +171,21 @@ const ProcurementDashboard: React.FC = () => {
 
   // Export to CSV
   const exportToCSV = () => {
-    const csv = [
-      ['ID', 'Title', 'Organization', 'Portal', 'Value', 'Closing Date', 'Location', 'Priority', 'Matching Courses', 'URL'],
-      ...tenders.map((t: Tender) => [
-        t.tender_id,
-        `"${t.title.replace(/"/g, '""')}"`,
-        `"${t.organization.replace(/"/g, '""')}"`,
-        t.portal,
-        t.value,
-        t.closing_date ? new Date(t.closing_date).toLocaleDateString() : 'N/A',
-        t.location,
-        t.priority,
-        `"${t.matching_courses.join('; ')}"`,
-        t.tender_url
-      ])
-    ].map(row => row.join(',')).join('\n');
+    // One string per row; the Blob joins the parts, so the whole file is never built as one string
+    const rows = tenders.map((t: Tender) => [
+      t.tender_id,
+      t.title,
+      t.organization,
+      t.portal,
+      t.value,
+      t.closing_date ? new Date(t.closing_date).toLocaleDateString() : 'N/A',
+      t.location,
+      t.priority,
+      t.matching_courses.join('; '),
+      t.tender_url
+    ].map(csvField).join(',') + '\n');
 
-    const blob = new Blob([csv], { type: 'text/csv;charset=utf-8;' });
+    const blob = new Blob([CSV_HEADER, ...rows], { type: 'text/csv;charset=utf-8;' });
     const url = window.URL.createObjectURL(blob);
     const a = document.createElement('a');
     a.href = url;
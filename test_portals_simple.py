@@ -367,13 +367,19 @@ class SimplePortalTester:
                 ("BidsandTenders", self.test_bidsandtenders)
             ]
             
-            for portal_name, test_func in portals:
+            # Portals are independent: fetch them concurrently over the one session
+            results = await asyncio.gather(
+                *(test_func() for _, test_func in portals), return_exceptions=True
+            )
+            
+            for (portal_name, _), tenders in zip(portals, results):
                 try:
                     logger.info(f"\n{'='*60}")
-                    logger.info(f"🎯 Testing {portal_name}")
+                    logger.info(f"🎯 Results for {portal_name}")
                     logger.info(f"{'='*60}")
                     
-                    tenders = await test_func()
+                    if isinstance(tenders, Exception):
+                        raise tenders
                     all_tenders.extend(tenders)
                     
                     # Save to database
@@ -25,7 +25,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Import our modules
-from backend.local_selenium import get_local_selenium_manager
+from backend.local_selenium import close_local_driver_pool, get_local_driver_pool, get_local_selenium_manager
 from backend.models import SessionLocal, save_tender_to_db
 from backend.scrapers import MERXScraper, CanadaBuysScraper
 
@@ -34,6 +34,8 @@ class FocusedPortalTester:
     
     def __init__(self):
         self.selenium_manager = get_local_selenium_manager()
+        # One Chrome is reused across the portals instead of started per test
+        self.driver_pool = get_local_driver_pool()
         self.db = SessionLocal()
         self.total_tenders = 0
         
@@ -43,8 +45,8 @@ class FocusedPortalTester:
         
         driver = None
         try:
-            # Create local driver
-            driver = self.selenium_manager.create_driver()
+            # Borrow the pooled local driver
+            driver = self.driver_pool.checkout()
             if not driver:
                 logger.error("❌ Failed to create driver for CanadaBuys")
                 return []
@@ -116,7 +118,7 @@ class FocusedPortalTester:
             return []
         finally:
             if driver:
-                self.selenium_manager.safe_quit_driver(driver)
+                self.driver_pool.release(driver)
     
     async def test_merx(self):
         """Test MERX portal"""
@@ -124,8 +126,8 @@ class FocusedPortalTester:
         
         driver = None
         try:
-            # Create local driver
-            driver = self.selenium_manager.create_driver()
+            # Borrow the pooled local driver
+            driver = self.driver_pool.checkout()
             if not driver:
                 logger.error("❌ Failed to create driver for MERX")
                 return []
@@ -196,7 +198,7 @@ class FocusedPortalTester:
             return []
         finally:
             if driver:
-                self.selenium_manager.safe_quit_driver(driver)
+                self.driver_pool.release(driver)
     
     async def test_bidsandtenders(self):
         """Test BidsandTenders portal"""
@@ -204,8 +206,8 @@ class FocusedPortalTester:
         
         driver = None
         try:
-            # Create local driver 
-            driver = self.selenium_manager.create_driver()
+            # Borrow the pooled local driver
+            driver = self.driver_pool.checkout()
             if not driver:
                 logger.error("❌ Failed to create driver for BidsandTenders")
                 return []
@@ -277,7 +279,7 @@ class FocusedPortalTester:
             return []
         finally:
             if driver:
-                self.selenium_manager.safe_quit_driver(driver)
+                self.driver_pool.release(driver)
     
     async def run_all_tests(self):
         """Run tests for all 3 portals"""
@@ -346,6 +348,8 @@ async def main():
     except Exception as e:
         logger.error(f"❌ Test failed: {e}")
         return 1
+    finally:
+        close_local_driver_pool()
     
     return 0
 